@@ -6,9 +6,18 @@ beyond what MCP servers provide.
 """
 
 import os
+import re
+import sys
+import stat
+import platform
+import fnmatch
+import locale
 import subprocess
 import logging
-from typing import List, Any, Optional
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Any, NamedTuple, Optional, Tuple
 from pathlib import Path
 
 from langchain.tools import tool
@@ -17,6 +26,238 @@ from langchain.tools import tool
 # Default workspace - use current directory or NeuralProtocol folder
 default_workspace = os.getcwd()
 
+# find_files fans out over top-level subdirectories once there are this many
+_PARALLEL_MIN_SUBDIRS = 4
+_FIND_WORKERS = min(8, os.cpu_count() or 4)
+
+# Bytes of stdout/stderr kept from run_command; the rest is drained and dropped
+_OUTPUT_CAP = 64 * 1024
+
+# Largest file read_file_content will load
+_MAX_READ_BYTES = 1024 * 1024
+
+# Constant message templates shared by the tools below
+_OK_CMD = "✅ Command executed successfully in CMD:\n{}"
+_OK_PS = "✅ Command executed successfully in PowerShell (CMD fallback):\n{}"
+_ERR_BOTH = "❌ Both CMD and PowerShell failed.\nCMD error: {}\nPowerShell error: {}"
+_ERR_CMD = "❌ Command failed in CMD: {}"
+_ERR_NO_DIR = "❌ Directory does not exist: {}"
+_ERR_NOT_DIR = "❌ Path is not a directory: {}"
+_HDR_CONTENTS = "📁 Contents of {}:\n"
+_HDR_FOUND = "🔍 Found {} files matching '{}' in {}:\n"
+_HDR_NOT_FOUND = "🔍 No files found matching pattern '{}' in {}"
+_ROW_DIR = "  📁 {}/"
+_ROW_FILE = "  📄 {} {}"
+_ROW_FILE_NOSIZE = "  📄 {} (size unknown)"
+
+# stderr phrases that mean CMD did not understand the command
+_CMD_NOTFOUND_RE = re.compile(r"not recognized|command not found", re.IGNORECASE)
+
+# fnmatch.fnmatch compares case-insensitively on platforms that normalise case
+_GLOB_FLAGS = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+
+
+def _compile_glob(pattern: str) -> re.Pattern:
+    """
+    Compile a shell-style wildcard pattern once so it can be reused per entry.
+    """
+    rx = fnmatch.translate(pattern).replace(r"[\s\S]", r"(?s:.)")
+    return re.compile(rx, _GLOB_FLAGS)
+
+
+class _CommandOutput(NamedTuple):
+    """Exit code and decoded (possibly truncated) output of a shell command."""
+    returncode: int
+    stdout: str
+    stderr: str
+
+
+def _drain(stream, buf: bytearray, cap: int) -> None:
+    """
+    Read a pipe to EOF, keeping at most cap + 1 bytes so truncation is detectable.
+    """
+    with stream:
+        while chunk := stream.read(4096):
+            if len(buf) <= cap:
+                buf += chunk[:cap + 1 - len(buf)]
+
+
+def _decode_output(buf: bytearray, cap: int) -> str:
+    """Decode captured output the way text-mode subprocess would, noting truncation."""
+    text = bytes(buf[:cap]).decode(locale.getpreferredencoding(False), errors='replace')
+    # Universal newlines: \r\n and lone \r both become \n
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    if len(buf) > cap:
+        text += "\n... (output truncated)"
+    return text
+
+
+def _run_shell(command: str, cap: int = _OUTPUT_CAP) -> _CommandOutput:
+    """
+    Run a shell command in the workspace, keeping only the first cap bytes of each stream.
+    
+    Both pipes are drained to EOF so the child never blocks on a full pipe,
+    but memory stays bounded regardless of how much the command prints.
+    """
+    proc = subprocess.Popen(
+        command,
+        shell=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=default_workspace  # Use NeuralProtocol workspace
+    )
+    out, err = bytearray(), bytearray()
+    err_reader = threading.Thread(target=_drain, args=(proc.stderr, err, cap), daemon=True)
+    err_reader.start()
+    _drain(proc.stdout, out, cap)
+    err_reader.join()
+    returncode = proc.wait()
+    return _CommandOutput(returncode, _decode_output(out, cap), _decode_output(err, cap))
+
+
+def _abspath(path: str) -> str:
+    """
+    Make a path absolute without resolving symlinks (no filesystem access).
+    """
+    raw = os.fspath(path)
+    return raw if os.path.isabs(raw) else os.path.abspath(raw)
+
+
+def _sort_key(item) -> str:
+    """Sort directory entries by name the way the filesystem compares them."""
+    return os.path.normcase(item.name)
+
+
+def _iter_matching_files(
+    root: str,
+    matcher: re.Pattern,
+    rel_prefix: str = "",
+    stop: Optional[threading.Event] = None,
+) -> Iterator[Tuple[str, os.DirEntry]]:
+    """
+    Lazily walk a directory tree and yield files whose name matches a pattern.
+    
+    Uses an explicit stack instead of recursion so deep trees cannot hit the
+    recursion limit, and only opens the next directory when the caller asks
+    for more results. Each match is yielded with its path relative to root.
+    The walk ends early once the optional stop event is set.
+    """
+    stack = deque([(root, rel_prefix)])
+    while stack:
+        if stop is not None and stop.is_set():
+            return
+        current, rel_prefix = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                subdirs = []
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append((entry.path, rel_prefix + entry.name + os.sep))
+                        elif entry.is_file() and matcher.fullmatch(entry.name):
+                            yield rel_prefix + entry.name, entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+        # Reverse so directories are visited in scandir order
+        stack.extend(reversed(subdirs))
+
+
+def _entry_size(entry: os.DirEntry) -> Optional[int]:
+    """Return the size of a directory entry, or None if it cannot be read."""
+    try:
+        return entry.stat().st_size
+    except OSError:
+        return None
+
+
+def _walk_one(
+    root: str,
+    rel_prefix: str,
+    matcher: re.Pattern,
+    budget: int,
+    stop: Optional[threading.Event] = None,
+) -> List[Tuple[str, Optional[int]]]:
+    """
+    Collect up to budget matching files (relative path, size) under one subtree.
+    """
+    found = []
+    for relative_path, entry in _iter_matching_files(root, matcher, rel_prefix, stop):
+        found.append((relative_path, _entry_size(entry)))
+        if len(found) >= budget:
+            break
+    return found
+
+
+def _rglob_matching_files(root: str, pattern: str, max_results: int) -> List[Tuple[str, Optional[int]]]:
+    """
+    Find up to max_results files below root with pathlib's rglob.
+    
+    Used for patterns that reach into subdirectories (src/*.py, **/*.py),
+    which cannot be matched against a bare entry name.
+    """
+    found = []
+    base = Path(root)
+    for file_path in base.rglob(pattern):
+        if len(found) >= max_results:
+            break
+        try:
+            if not file_path.is_file():
+                continue
+            size = file_path.stat().st_size
+        except OSError:
+            size = None
+        found.append((str(file_path.relative_to(base)), size))
+    return found
+
+
+def _find_matching_files(root: str, matcher: re.Pattern, max_results: int) -> List[Tuple[str, Optional[int]]]:
+    """
+    Find up to max_results matching files below root.
+    
+    Directory reads release the GIL, so wide trees are scanned with one thread
+    per top-level subdirectory. Results keep the sequential walk order.
+    """
+    found = []
+    subdirs = []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append((entry.path, entry.name + os.sep))
+                elif entry.is_file() and matcher.fullmatch(entry.name):
+                    found.append((entry.name, _entry_size(entry)))
+                    if len(found) >= max_results:
+                        return found
+            except OSError:
+                continue
+    
+    if len(subdirs) < _PARALLEL_MIN_SUBDIRS:
+        for subdir, rel_prefix in subdirs:
+            found.extend(_walk_one(subdir, rel_prefix, matcher, max_results - len(found)))
+            if len(found) >= max_results:
+                break
+        return found
+    
+    stop = threading.Event()
+    with ThreadPoolExecutor(max_workers=_FIND_WORKERS) as pool:
+        futures = [
+            pool.submit(_walk_one, subdir, rel_prefix, matcher, max_results, stop)
+            for subdir, rel_prefix in subdirs
+        ]
+        try:
+            for future in futures:
+                found.extend(future.result()[:max_results - len(found)])
+                if len(found) >= max_results:
+                    break
+        finally:
+            # Let in-flight walkers bail out and drop the ones not started yet
+            stop.set()
+            for future in futures:
+                future.cancel()
+    return found
+
 
 @tool()
 def run_command(command: str) -> str:
@@ -34,42 +275,27 @@ def run_command(command: str) -> str:
     """
     try:
         # First attempt: Try running in CMD
-        result = subprocess.run(
-            command, 
-            shell=True, 
-            capture_output=True, 
-            text=True, 
-            cwd=default_workspace  # Use NeuralProtocol workspace
-        )
+        result = _run_shell(command)
         
         if result.returncode == 0:
-            return f"✅ Command executed successfully in CMD:\n{result.stdout}"
+            return _OK_CMD.format(result.stdout)
         else:
             # Check if it's a "not recognized" error (CMD failure)
             error_output = result.stderr.strip()
-            if any(phrase in error_output.lower() for phrase in [
-                "not recognized", "not recognized as an internal or external command",
-                "is not recognized", "command not found"
-            ]):
+            if _CMD_NOTFOUND_RE.search(error_output) is not None:
                 # Try PowerShell fallback
                 logging.info(f"🔄 CMD command failed, trying PowerShell: {command}")
                 powershell_command = f'powershell -Command "{command}"'
                 
-                ps_result = subprocess.run(
-                    powershell_command,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    cwd=default_workspace
-                )
+                ps_result = _run_shell(powershell_command)
                 
                 if ps_result.returncode == 0:
-                    return f"✅ Command executed successfully in PowerShell (CMD fallback):\n{ps_result.stdout}"
+                    return _OK_PS.format(ps_result.stdout)
                 else:
-                    return f"❌ Both CMD and PowerShell failed.\nCMD error: {error_output}\nPowerShell error: {ps_result.stderr}"
+                    return _ERR_BOTH.format(error_output, ps_result.stderr)
             else:
                 # Other type of error, return CMD error
-                return f"❌ Command failed in CMD: {error_output}"
+                return _ERR_CMD.format(error_output)
             
     except Exception as e:
         return f"❌ Error running command: {e}"
@@ -89,34 +315,39 @@ def list_files(directory: str = ".", pattern: str = "*", include_hidden: bool =
         Formatted string listing the contents of the directory
     """
     try:
-        path = Path(directory).resolve()
-        
-        if not path.exists():
-            return f"❌ Directory does not exist: {directory}"
+        path = _abspath(directory)
         
-        if not path.is_dir():
-            return f"❌ Path is not a directory: {directory}"
+        if not os.path.isdir(path):
+            if not os.path.exists(path):
+                return _ERR_NO_DIR.format(directory)
+            return _ERR_NOT_DIR.format(directory)
         
         # Get all items matching pattern
         if pattern == "*":
-            items = list(path.iterdir())
+            with os.scandir(path) as entries:
+                items = list(entries)
+        elif os.sep in pattern or "/" in pattern:
+            # Patterns reaching into subdirectories still need pathlib's glob
+            items = list(Path(path).glob(pattern))
         else:
-            items = list(path.glob(pattern))
+            matcher = _compile_glob(pattern)
+            with os.scandir(path) as entries:
+                items = [entry for entry in entries if matcher.fullmatch(entry.name)]
         
         # Filter hidden files if requested
         if not include_hidden:
             items = [item for item in items if not item.name.startswith('.')]
         
         # Sort items: directories first, then files
-        directories = sorted([item for item in items if item.is_dir()])
-        files = sorted([item for item in items if item.is_file()])
+        directories = sorted((item for item in items if item.is_dir()), key=_sort_key)
+        files = sorted((item for item in items if item.is_file()), key=_sort_key)
         
-        result = [f"📁 Contents of {path}:\n"]
+        result = [_HDR_CONTENTS.format(path)]
         
         if directories:
             result.append("📂 Directories:")
             for dir_item in directories:
-                result.append(f"  📁 {dir_item.name}/")
+                result.append(_ROW_DIR.format(dir_item.name))
         
         if files:
             if directories:
@@ -126,9 +357,9 @@ def list_files(directory: str = ".", pattern: str = "*", include_hidden: bool =
                 try:
                     size = file_item.stat().st_size
                     size_str = f"({size:,} bytes)" if size < 1024 else f"({size/1024:.1f} KB)"
-                    result.append(f"  📄 {file_item.name} {size_str}")
+                    result.append(_ROW_FILE.format(file_item.name, size_str))
                 except OSError:
-                    result.append(f"  📄 {file_item.name} (size unknown)")
+                    result.append(_ROW_FILE_NOSIZE.format(file_item.name))
         
         if not directories and not files:
             result.append("📭 Directory is empty")
@@ -154,30 +385,47 @@ def read_file_content(file_path: str, max_lines: int = 100) -> str:
         The content of the file or an error message
     """
     try:
-        path = Path(file_path).resolve()
+        path = _abspath(file_path)
         
-        if not path.exists():
+        # One stat answers existence, type and size
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
             return f"❌ File does not exist: {file_path}"
         
-        if not path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return f"❌ Path is not a file: {file_path}"
         
-        # Check file size
-        size = path.stat().st_size
-        if size > 1024 * 1024:  # 1MB limit
+        size = st.st_size
+        if size > _MAX_READ_BYTES:
             return f"❌ File too large ({size:,} bytes). Maximum size is 1MB."
         
-        # Read file content
-        with open(path, 'r', encoding='utf-8', errors='ignore') as file:
-            lines = []
-            line_count = 0
-            
-            for line in file:
-                if line_count >= max_lines:
-                    lines.append(f"\n... (truncated after {max_lines} lines)")
+        # Read the whole file into a pre-sized buffer
+        buf = bytearray(size)
+        view = memoryview(buf)
+        offset = 0
+        with open(path, 'rb', buffering=0) as file:
+            while offset < size:
+                n = file.readinto(view[offset:])
+                if not n:
                     break
-                lines.append(f"{line_count + 1:4d}| {line.rstrip()}")
-                line_count += 1
+                offset += n
+        view.release()
+        
+        # Split on universal newlines, matching text-mode iteration
+        text = buf[:offset].decode('utf-8', errors='ignore')
+        raw_lines = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+        if raw_lines[-1] == '':
+            raw_lines.pop()
+        
+        lines = []
+        line_count = 0
+        for line in raw_lines:
+            if line_count >= max_lines:
+                lines.append(f"\n... (truncated after {max_lines} lines)")
+                break
+            lines.append(f"{line_count + 1:4d}| {line.rstrip()}")
+            line_count += 1
         
         content = "\n".join(lines)
         
@@ -203,10 +451,10 @@ def write_file_content(file_path: str, content: str, append: bool = False) -> st
         Success or error message
     """
     try:
-        path = Path(file_path).resolve()
+        path = _abspath(file_path)
         
         # Create parent directories if they don't exist
-        path.parent.mkdir(parents=True, exist_ok=True)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
         
         mode = 'a' if append else 'w'
         action = "appended to" if append else "written to"
@@ -214,7 +462,7 @@ def write_file_content(file_path: str, content: str, append: bool = False) -> st
         with open(path, mode, encoding='utf-8') as file:
             file.write(content)
         
-        size = path.stat().st_size
+        size = os.path.getsize(path)
         
         return f"✅ Content {action} file: {path}\n📊 File size: {size:,} bytes"
         
@@ -231,9 +479,6 @@ def get_system_info() -> str:
         System information including OS, Python version, working directory, etc.
     """
     try:
-        import platform
-        import sys
-        
         info = []
         info.append("🖥️ System Information:")
         info.append(f"  OS: {platform.system()} {platform.release()}")
@@ -275,38 +520,35 @@ def find_files(search_pattern: str, directory: str = ".", max_results: int = 50)
         List of matching files with their paths and sizes
     """
     try:
-        path = Path(directory).resolve()
-        
-        if not path.exists():
-            return f"❌ Directory does not exist: {directory}"
+        path = _abspath(directory)
         
-        if not path.is_dir():
-            return f"❌ Path is not a directory: {directory}"
+        if not os.path.isdir(path):
+            if not os.path.exists(path):
+                return _ERR_NO_DIR.format(directory)
+            return _ERR_NOT_DIR.format(directory)
         
-        # Search for files
+        # Search for files, stopping the walk as soon as we have enough
         matches = []
         count = 0
         
-        for file_path in path.rglob(search_pattern):
-            if count >= max_results:
-                break
-                
-            if file_path.is_file():
-                try:
-                    size = file_path.stat().st_size
-                    relative_path = file_path.relative_to(path)
+        if max_results > 0:
+            if os.sep in search_pattern or "/" in search_pattern:
+                # Patterns reaching into subdirectories still need pathlib's glob
+                found = _rglob_matching_files(path, search_pattern, max_results)
+            else:
+                found = _find_matching_files(path, _compile_glob(search_pattern), max_results)
+            for relative_path, size in found:
+                if size is None:
+                    matches.append(_ROW_FILE_NOSIZE.format(relative_path))
+                else:
                     size_str = f"{size:,} bytes" if size < 1024 else f"{size/1024:.1f} KB"
-                    matches.append(f"  📄 {relative_path} ({size_str})")
-                    count += 1
-                except OSError:
-                    relative_path = file_path.relative_to(path)
-                    matches.append(f"  📄 {relative_path} (size unknown)")
-                    count += 1
+                    matches.append(_ROW_FILE.format(relative_path, f"({size_str})"))
+                count += 1
         
         if not matches:
-            return f"🔍 No files found matching pattern '{search_pattern}' in {path}"
+            return _HDR_NOT_FOUND.format(search_pattern, path)
         
-        result = [f"🔍 Found {len(matches)} files matching '{search_pattern}' in {path}:\n"]
+        result = [_HDR_FOUND.format(len(matches), search_pattern, path)]
         result.extend(matches)
         
         if count >= max_results:
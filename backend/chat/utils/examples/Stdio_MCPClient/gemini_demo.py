@@ -5,8 +5,9 @@ Simple Gemini Demo - Shows the Gemini integration working
 
 import os
 import logging
+import importlib
+from typing import Optional
 from dotenv import load_dotenv
-import google.generativeai as genai
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -14,6 +15,26 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(
 # Load environment variables
 load_dotenv()
 
+
+def _lazy_genai():
+    """Import google.generativeai on first use; it is slow to import."""
+    return importlib.import_module("google.generativeai")
+
+
+def _to_gemini_history(messages: list[dict[str, str]], system: str = "") -> list[dict]:
+    """Convert chat messages to Gemini history, folding the system prompt into the first user turn."""
+    history = []
+    for msg in messages:
+        if msg["role"] == "user":
+            text = msg["content"]
+            if system and not history:
+                text = f"{system}\n\n{text}"
+            history.append({"role": "user", "parts": [text]})
+        elif msg["role"] == "assistant":
+            history.append({"role": "model", "parts": [msg["content"]]})
+    return history
+
+
 class SimpleGeminiClient:
     """Simple Gemini client for testing the integration."""
     
@@ -24,8 +45,13 @@ class SimpleGeminiClient:
             raise ValueError("GOOGLE_API_KEY not found in environment variables")
         
         # Configure Gemini
+        genai = _lazy_genai()
         genai.configure(api_key=api_key)
         self.model = genai.GenerativeModel('gemini-2.0-flash')
+        # Persistent chat session so each turn only sends the new message
+        self._chat: Optional["genai.ChatSession"] = None
+        self._system: str = ""
+        self._seen: int = 0
         print("✅ Gemini client initialized successfully!")
     
     def get_response(self, messages: list[dict[str, str]]) -> str:
@@ -38,25 +64,28 @@ class SimpleGeminiClient:
             The LLM's response as a string.
         """
         try:
-            # Build the conversation context
-            conversation_context = ""
+            system = "\n\n".join(m["content"] for m in messages if m["role"] == "system")
+            turns = [m for m in messages if m["role"] != "system"]
+            new_turns = turns[self._seen:]
             
-            for msg in messages:
-                if msg["role"] == "system":
-                    # Add system message to context
-                    conversation_context += f"{msg['content']}\n\n"
-                elif msg["role"] == "user":
-                    # Add user message
-                    conversation_context += f"User: {msg['content']}\n"
-                elif msg["role"] == "assistant":
-                    # Add assistant message
-                    conversation_context += f"Assistant: {msg['content']}\n"
+            # Reuse the session only when the caller just appended new user turns
+            if (
+                self._chat is None
+                or system != self._system
+                or not new_turns
+                or any(m["role"] != "user" for m in new_turns)
+            ):
+                self._system = system
+                self._chat = self.model.start_chat(history=_to_gemini_history(turns[:-1], system))
+                new_turns = turns[-1:]
             
-            # Add the current user prompt
-            conversation_context += "Assistant: "
+            prompt = "\n".join(m["content"] for m in new_turns)
+            if not self._chat.history and system:
+                prompt = f"{system}\n\n{prompt}"
             
-            # Generate response
-            response = self.model.generate_content(conversation_context)
+            response = self._chat.send_message(prompt)
+            # The session now also holds the reply the caller will append
+            self._seen = len(turns) + 1
             return response.text
             
         except Exception as e:
@@ -7,52 +7,233 @@ Uses langchain_mcp_adapters for streamable_http and sse, custom aiohttp for http
 """
 
 import asyncio
+import itertools
 import json
 import logging
+import re
 import aiohttp
+import orjson
 import time
-from typing import Any, Dict, List, Optional
-from contextlib import AsyncExitStack
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 from urllib.parse import urljoin
 from datetime import datetime
 
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
 from langchain_mcp_adapters.client import MultiServerMCPClient
 
+# Optional: run on uvloop when it is installed (not available on Windows). Only
+# replaces the stock asyncio policy so a policy chosen by the host app is kept.
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+else:
+    if type(asyncio.get_event_loop_policy()) is asyncio.DefaultEventLoopPolicy:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize request bodies with orjson for aiohttp's json= argument."""
+    return orjson.dumps(obj).decode()
+
+
+# Bodies larger than this (or of unknown length) are read in chunks
+_STREAM_THRESHOLD = 1024 * 1024
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+async def _iter_sse_events(response: aiohttp.ClientResponse) -> AsyncIterator[bytes]:
+    """Yield the data payload of each server-sent event as soon as it is complete."""
+    data: List[bytes] = []
+    async for raw_line in response.content:
+        line = raw_line.rstrip(b"\r\n")
+        if not line:
+            if data:
+                yield b"\n".join(data)
+                data = []
+        elif line.startswith(b"data:"):
+            value = line[5:]
+            data.append(value[1:] if value.startswith(b" ") else value)
+    if data:
+        yield b"\n".join(data)
+
+
+async def _read_json(response: aiohttp.ClientResponse) -> Any:
+    """Decode a JSON (or SSE-wrapped JSON) response body without an intermediate str.
+    
+    Event streams are parsed line by line and the last event's JSON is returned.
+    Large or chunked bodies are collected with iter_chunked into one buffer.
+    An empty or whitespace-only body yields None.
+    """
+    if response.headers.get('content-type', '').startswith('text/event-stream'):
+        result = None
+        async for data in _iter_sse_events(response):
+            if data:
+                result = orjson.loads(data)
+        return result
+    
+    length = response.content_length
+    if length is not None and length <= _STREAM_THRESHOLD:
+        body = await response.read()
+    else:
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(_STREAM_CHUNK_SIZE):
+            body += chunk
+    # An empty body decodes to None, as ClientResponse.json() does
+    if not body.strip():
+        return None
+    return orjson.loads(body)
+
+
+# Skeleton for JSON-RPC requests sent over the MCP protocol fallback
+_MCP_REQUEST_TEMPLATE: Dict[str, Any] = {"jsonrpc": "2.0", "id": 0, "method": None, "params": None}
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+def _fresh_until(cache_control: Optional[str]) -> float:
+    """Return the monotonic deadline until which a response may be reused without revalidation."""
+    if not cache_control or "no-cache" in cache_control or "no-store" in cache_control:
+        return 0.0
+    match = _MAX_AGE_RE.search(cache_control)
+    return time.monotonic() + int(match.group(1)) if match else 0.0
+
+
+def _make_connector(ssl_verify: bool = True, limit: int = 0) -> aiohttp.TCPConnector:
+    """Create a pooled TCP connector for MCP HTTP traffic."""
+    return aiohttp.TCPConnector(
+        ssl=ssl_verify,
+        use_dns_cache=True,
+        ttl_dns_cache=300,
+        # Keep idle connections pooled so repeat calls skip the TCP/TLS handshake
+        limit=limit,
+        limit_per_host=16,
+        keepalive_timeout=300,
+        force_close=False,
+        enable_cleanup_closed=True
+    )
+
 
 class HttpServerConfig(BaseModel):
     """Pydantic model for HTTP/SSE server configuration."""
+    model_config = ConfigDict(frozen=True)
+    
     transport: str = Field(..., description="Transport type (http, sse, or streamable_http)")
     url: str = Field(..., description="Base URL for the server")
     headers: Optional[Dict[str, str]] = Field(None, description="Additional headers")
     timeout: Optional[int] = Field(30, description="Request timeout in seconds")
     ssl_verify: Optional[bool] = Field(True, description="Verify SSL certificates")
+    include_timestamp: bool = Field(False, description="Send a timestamp with REST tool calls")
+
+
+# Validates a whole ``mcpServers`` mapping in one pass instead of per entry.
+_SERVERS_ADAPTER = TypeAdapter(Dict[str, HttpServerConfig])
+_HTTP_TRANSPORTS = frozenset(("http", "sse", "streamable_http"))
 
 
 class HttpMCPServer:
     """Manages HTTP/SSE MCP server connections."""
 
-    def __init__(self, name: str, config: Dict[str, Any]) -> None:
+    __slots__ = (
+        'name', 'config', 'session', 'is_connected', '_cleaned', '_cleanup_done',
+        'base_url', '_tool_url_prefixes', '_list_urls', '_base_headers', '_request_headers',
+        '_request_options', '_shared_session', '_mcp_session_id', '_id_counter',
+        '_timestamp_bucket', '_timestamp', '_tool_endpoint', '_list_endpoint', '_use_mcp_protocol',
+        '_langchain_client', '_langchain_tools', '_tool_index', '_tools_cache',
+    )
+
+    def __init__(self, name: str, config: Union[Dict[str, Any], HttpServerConfig]) -> None:
         self.name = name
         try:
-            self.config = HttpServerConfig(**config)
+            self.config = HttpServerConfig.model_validate(config)
         except ValidationError as e:
             logging.error(f"Invalid HTTP server configuration for {name}: {e}")
             raise
         
         self.session: Optional[aiohttp.ClientSession] = None
         self.is_connected = False
-        self._cleanup_lock = asyncio.Lock()
-        self.exit_stack = AsyncExitStack()
+        # Cleanup runs once; concurrent callers just wait for it to finish
+        self._cleaned = False
+        self._cleanup_done = asyncio.Event()
         self.base_url = self.config.url.rstrip('/')
-        self.mcp_session_id: Optional[str] = None
+        
+        # Endpoint URLs are fixed per server, so resolve them once
+        self._tool_url_prefixes = tuple(
+            (endpoint, urljoin(self.base_url, endpoint))
+            for endpoint in ('/tools/', '/api/tools/', '/mcp/tools/')
+        )
+        self._list_urls = tuple(
+            (endpoint, urljoin(self.base_url, endpoint))
+            for endpoint in ('/tools', '/api/tools', '/mcp/tools')
+        )
+        
+        # Per-request headers, kept in sync with mcp_session_id. When the session is
+        # shared with other servers, this server's own headers travel per request too.
+        self._base_headers: Dict[str, str] = {}
+        self._request_headers: Dict[str, str] = {}
+        self._request_options: Dict[str, Any] = {}
+        self._shared_session: Optional[aiohttp.ClientSession] = None
+        self._mcp_session_id: Optional[str] = None
+        self._id_counter = itertools.count(1)
+        
+        # Timestamp string reused within the same second (only if include_timestamp)
+        self._timestamp_bucket = -1
+        self._timestamp = ""
+        
+        # Endpoints that answered last time, tried first on the next call
+        self._tool_endpoint: Optional[Tuple[str, str]] = None
+        self._list_endpoint: Optional[Tuple[str, str]] = None
+        self._use_mcp_protocol = False
         
         # For langchain adapters
         self._langchain_client: Optional[MultiServerMCPClient] = None
         self._langchain_tools: List[Any] = []
+        self._tool_index: Dict[str, Any] = {}
+        
+        # Conditional-GET cache for REST tool lists: url -> (etag, last-modified, tools, fresh until)
+        self._tools_cache: Dict[str, Tuple[Optional[str], Optional[str], List[Dict[str, Any]], float]] = {}
+
+    @property
+    def mcp_session_id(self) -> Optional[str]:
+        """MCP session ID announced by the server, if any."""
+        return self._mcp_session_id
+
+    @mcp_session_id.setter
+    def mcp_session_id(self, value: Optional[str]) -> None:
+        self._mcp_session_id = value
+        self._request_headers = {**self._base_headers, 'mcp-session-id': value} if value else dict(self._base_headers)
+
+    def attach_session(self, session: Optional[aiohttp.ClientSession]) -> None:
+        """Use a ClientSession owned by the studio instead of creating one per server."""
+        self._shared_session = session
+
+    @staticmethod
+    def _remembered_first(candidates: tuple, remembered: Optional[tuple]) -> tuple:
+        """Order endpoint candidates so the last one that worked is tried first."""
+        if remembered is None:
+            return candidates
+        return (remembered,) + tuple(c for c in candidates if c != remembered)
+
+    def _current_timestamp(self) -> str:
+        """Return an ISO timestamp, formatted at most once per second."""
+        bucket = int(time.monotonic())
+        if bucket != self._timestamp_bucket:
+            self._timestamp_bucket = bucket
+            self._timestamp = datetime.now().isoformat()
+        return self._timestamp
+
+    def _mcp_request(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a JSON-RPC request from the shared template with a fresh id."""
+        request = _MCP_REQUEST_TEMPLATE.copy()
+        request["id"] = next(self._id_counter)
+        request["method"] = method
+        request["params"] = params
+        return request
 
     async def initialize(self) -> None:
         """Initialize the HTTP/SSE server connection."""
+        self._cleaned = False
+        self._cleanup_done = asyncio.Event()
         try:
             transport = self.config.transport.lower()
             
@@ -81,6 +262,12 @@ class HttpMCPServer:
             
             self._langchain_client = MultiServerMCPClient(server_config)
             self.is_connected = True
+            
+            # Fetch the tool catalog once; later calls are served from the cache
+            try:
+                await self.refresh_tools()
+            except Exception as e:
+                logging.warning(f"⚠️ Could not prefetch tools from {self.name}: {e}")
             logging.info(f"✅ HTTP/SSE Server {self.name} ({self.config.transport}) initialized with langchain adapters")
             
         except Exception as e:
@@ -90,20 +277,24 @@ class HttpMCPServer:
     async def _initialize_aiohttp(self) -> None:
         """Initialize using custom aiohttp implementation."""
         try:
-            connector = aiohttp.TCPConnector(ssl=self.config.ssl_verify)
             timeout = aiohttp.ClientTimeout(total=self.config.timeout)
             
             headers = self.config.headers or {}
             headers.setdefault('User-Agent', 'NeuralProtocol-MCP-Client/1.0')
             headers.setdefault('Accept', 'application/json')
+            headers.setdefault('Connection', 'keep-alive')
             
-            self.session = await self.exit_stack.enter_async_context(
-                aiohttp.ClientSession(
-                    connector=connector,
-                    timeout=timeout,
-                    headers=headers
-                )
-            )
+            if self._shared_session is not None and not self._shared_session.closed:
+                # Shared session: pass this server's headers, timeout and SSL mode per request
+                self.session = self._shared_session
+                self._base_headers = dict(headers)
+                self._request_options = {"timeout": timeout}
+                if not self.config.ssl_verify:
+                    self._request_options["ssl"] = False
+                # Re-run the setter so the request headers pick up the base headers
+                self.mcp_session_id = self.mcp_session_id
+            else:
+                self.session = self._new_session(timeout, headers)
             
             await self._test_connection()
             self.is_connected = True
@@ -113,33 +304,72 @@ class HttpMCPServer:
             logging.error(f"❌ Error initializing aiohttp for {self.name}: {e}")
             raise
 
+    def _new_session(self, timeout: aiohttp.ClientTimeout, headers: Dict[str, str]) -> aiohttp.ClientSession:
+        """Open a private pooled session for this server."""
+        return aiohttp.ClientSession(
+            connector=_make_connector(self.config.ssl_verify),
+            timeout=timeout,
+            headers=headers,
+            json_serialize=_json_dumps
+        )
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the live session, reopening a private one if it was closed under a connected server."""
+        session = self.session
+        if session is None or session.closed:
+            if not self.is_connected:
+                raise RuntimeError(f"Session not initialized for {self.name}")
+            logging.info("🔄 Reopening HTTP session for %s", self.name)
+            headers = {
+                'User-Agent': 'NeuralProtocol-MCP-Client/1.0',
+                'Accept': 'application/json',
+                'Connection': 'keep-alive',
+                **(self.config.headers or {}),
+            }
+            session = self.session = self._new_session(aiohttp.ClientTimeout(total=self.config.timeout), headers)
+        return session
+
+    async def _probe_endpoint(self, endpoint: str) -> Optional[tuple]:
+        """GET one health endpoint; returns (endpoint, status, mcp session id) or None on error."""
+        try:
+            test_url = urljoin(self.base_url, endpoint)
+            async with self.session.get(test_url, headers=self._request_headers, **self._request_options) as response:
+                return endpoint, response.status, response.headers.get('mcp-session-id')
+        except Exception:
+            return None
+
     async def _test_connection(self) -> None:
         """Test connection to the server (aiohttp only)."""
         try:
-            # Try different health endpoints
+            # Probe the health endpoints concurrently; the first usable answer wins
             health_endpoints = ["/", "/health", "/status"]
+            tasks = [asyncio.create_task(self._probe_endpoint(endpoint)) for endpoint in health_endpoints]
             
-            for endpoint in health_endpoints:
-                try:
-                    test_url = urljoin(self.base_url, endpoint)
-                    async with self.session.get(test_url) as response:
-                        if response.status == 200:
+            try:
+                pending = set(tasks)
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in tasks:
+                        if task not in done or task.result() is None:
+                            continue
+                        endpoint, status, mcp_session_id = task.result()
+                        if status == 200:
                             logging.info(f"🔗 Connection to {self.name} verified at {endpoint}")
                             # Check for MCP session ID in headers
-                            mcp_session_id = response.headers.get('mcp-session-id')
                             if mcp_session_id:
                                 self.mcp_session_id = mcp_session_id
                                 logging.info(f"🔗 MCP session ID captured: {mcp_session_id}")
                             return
-                        elif response.status < 500:  # Client errors are acceptable
-                            logging.info(f"🔗 Connection to {self.name} verified at {endpoint} (status: {response.status})")
+                        elif status < 500:  # Client errors are acceptable
+                            logging.info(f"🔗 Connection to {self.name} verified at {endpoint} (status: {status})")
                             return
-                except Exception as e:
-                    continue
+            finally:
+                for task in tasks:
+                    task.cancel()
             
             # If all endpoints failed, try a basic GET to the base URL
             try:
-                async with self.session.get(self.base_url) as response:
+                async with self.session.get(self.base_url, headers=self._request_headers, **self._request_options) as response:
                     logging.info(f"🔗 Connection to {self.name} verified (status: {response.status})")
                     return
             except Exception as e:
@@ -160,101 +390,114 @@ class HttpMCPServer:
             # Use custom aiohttp
             return await self._call_tool_aiohttp(tool_name, arguments)
 
+    async def refresh_tools(self) -> List[Any]:
+        """Re-fetch the tool catalog from a langchain-backed server and rebuild the name index."""
+        if not self._langchain_client:
+            raise RuntimeError(f"Server {self.name} not initialized")
+        
+        tools = await self._langchain_client.get_tools()
+        self._langchain_tools = list(tools)
+        self._tool_index = {tool.name: tool for tool in self._langchain_tools}
+        return self._langchain_tools
+
+    async def get_langchain_tools(self) -> List[Any]:
+        """Return the cached langchain tools, fetching them on first use."""
+        if not self._langchain_tools:
+            await self.refresh_tools()
+        return self._langchain_tools
+
     async def _call_tool_langchain(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
         """Call tool using langchain adapters."""
         try:
-            tools = await self._langchain_client.get_tools()
+            await self.get_langchain_tools()
             
-            # Find the specific tool
-            for tool in tools:
-                if tool.name == tool_name:
-                    logging.info(f"🔧 Calling tool {tool_name} on {self.name} (langchain)")
-                    result = await tool.ainvoke(arguments)
-                    logging.info(f"✅ Tool {tool_name} executed successfully on {self.name}: {result}")
-                    return result
+            tool = self._tool_index.get(tool_name)
+            if tool is None:
+                # The server may have added the tool since the catalog was fetched
+                await self.refresh_tools()
+                tool = self._tool_index.get(tool_name)
+            if tool is None:
+                raise RuntimeError(f"Tool {tool_name} not found on server {self.name}")
             
-            raise RuntimeError(f"Tool {tool_name} not found on server {self.name}")
+            logging.info("🔧 Calling tool %s on %s (langchain)", tool_name, self.name)
+            result = await tool.ainvoke(arguments)
+            logging.info("✅ Tool %s executed successfully on %s: %s", tool_name, self.name, result)
+            return result
             
         except Exception as e:
-            logging.error(f"❌ Error calling tool {tool_name} on {self.name}: {e}")
+            logging.error("❌ Error calling tool %s on %s: %s", tool_name, self.name, e)
             raise
 
     async def _call_tool_aiohttp(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
         """Call tool using custom aiohttp implementation."""
-        if not self.session:
-            raise RuntimeError(f"Session not initialized for {self.name}")
+        session = self._get_session()
         
-        # Try different tool call endpoints
-        tool_endpoints = [f'/tools/{tool_name}', f'/api/tools/{tool_name}', f'/mcp/tools/{tool_name}']
+        # The payload is the same for every endpoint, so build it once per call
+        payload = {
+            "tool": tool_name,
+            "arguments": arguments
+        }
+        if self.config.include_timestamp:
+            payload["timestamp"] = self._current_timestamp()
         
-        for endpoint in tool_endpoints:
+        # Try different tool call endpoints, unless the server is known to speak only MCP
+        candidates = () if self._use_mcp_protocol else self._remembered_first(self._tool_url_prefixes, self._tool_endpoint)
+        for endpoint_prefix, url_prefix in candidates:
+            endpoint = endpoint_prefix + tool_name
             try:
-                url = urljoin(self.base_url, endpoint)
-                payload = {
-                    "tool": tool_name,
-                    "arguments": arguments,
-                    "timestamp": datetime.now().isoformat()
-                }
-                
-                # Add MCP session ID if available
-                headers = {}
-                if self.mcp_session_id:
-                    headers['mcp-session-id'] = self.mcp_session_id
+                url = url_prefix + tool_name
                 
-                logging.info(f"🔧 Calling tool {tool_name} on {self.name} at: {url}")
-                logging.info(f"📡 Request payload: {payload}")
+                logging.info("🔧 Calling tool %s on %s at: %s", tool_name, self.name, url)
+                logging.debug("📡 Request payload: %s", payload)
                 
-                async with self.session.post(url, json=payload, headers=headers) as response:
-                    logging.info(f"📡 Response from {url}: Status {response.status}")
+                async with session.post(url, json=payload, headers=self._request_headers, **self._request_options) as response:
+                    logging.info("📡 Response from %s: Status %s", url, response.status)
                     
                     if response.status == 200:
-                        result = await response.json()
-                        logging.info(f"✅ Tool {tool_name} executed successfully on {self.name}: {result}")
+                        result = await _read_json(response)
+                        self._tool_endpoint = (endpoint_prefix, url_prefix)
+                        logging.info("✅ Tool %s executed successfully on %s: %s", tool_name, self.name, result)
                         return result
                     elif response.status == 404:
-                        logging.info(f"❌ Endpoint {endpoint} not found (404) for tool {tool_name} on {self.name}")
-                        continue  # Try next endpoint
+                        logging.info("❌ Endpoint %s not found (404) for tool %s on %s", endpoint, tool_name, self.name)
                     else:
                         error_text = await response.text()
-                        logging.warning(f"⚠️ Unexpected response for tool {tool_name} on {self.name} at {endpoint}: {response.status} - {error_text}")
-                        continue
+                        logging.warning("⚠️ Unexpected response for tool %s on %s at %s: %s - %s", tool_name, self.name, endpoint, response.status, error_text)
             except Exception as e:
-                logging.error(f"❌ Error calling tool {tool_name} on {self.name} at {endpoint}: {e}")
-                continue
+                logging.error("❌ Error calling tool %s on %s at %s: %s", tool_name, self.name, endpoint, e)
+            
+            # This endpoint did not work; forget it if it was the remembered one
+            if self._tool_endpoint == (endpoint_prefix, url_prefix):
+                self._tool_endpoint = None
         
         # If all endpoints failed, try MCP protocol
-        logging.info(f"🔍 Trying MCP protocol for tool {tool_name} on {self.name} at: {self.base_url}")
+        logging.info("🔍 Trying MCP protocol for tool %s on %s at: %s", tool_name, self.name, self.base_url)
         try:
-            mcp_request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "tools/call",
-                "params": {
-                    "name": tool_name,
-                    "arguments": arguments
-                }
-            }
+            mcp_request = self._mcp_request("tools/call", {"name": tool_name, "arguments": arguments})
             
-            headers = {}
-            if self.mcp_session_id:
-                headers['mcp-session-id'] = self.mcp_session_id
-            
-            logging.info(f"📡 Sending MCP request to {self.name}: {mcp_request}")
-            async with self.session.post(self.base_url, json=mcp_request, headers=headers) as response:
-                logging.info(f"📡 MCP response from {self.name}: Status {response.status}")
+            logging.debug("📡 Sending MCP request to %s: %s", self.name, mcp_request)
+            async with session.post(self.base_url, json=mcp_request, headers=self._request_headers, **self._request_options) as response:
+                logging.info("📡 MCP response from %s: Status %s", self.name, response.status)
                 
                 if response.status == 200:
-                    result = await response.json()
-                    logging.info(f"✅ Tool {tool_name} executed via MCP protocol on {self.name}: {result}")
+                    result = await _read_json(response)
+                    self._use_mcp_protocol = True
+                    logging.info("✅ Tool %s executed via MCP protocol on %s: %s", tool_name, self.name, result)
                     return result.get('result', result)
                 else:
                     error_text = await response.text()
-                    logging.error(f"❌ MCP protocol failed for tool {tool_name} on {self.name}: {response.status} - {error_text}")
+                    logging.error("❌ MCP protocol failed for tool %s on %s: %s - %s", tool_name, self.name, response.status, error_text)
                     raise aiohttp.ClientError(f"HTTP {response.status}: {error_text}")
         except Exception as e:
-            logging.error(f"❌ MCP protocol error for tool {tool_name} on {self.name}: {e}")
+            logging.error("❌ MCP protocol error for tool %s on %s: %s", tool_name, self.name, e)
+            # Rediscover REST endpoints on the next call
+            self._use_mcp_protocol = False
             raise aiohttp.ClientError(f"All tool call methods failed: {e}")
 
+    def invalidate_tools_cache(self) -> None:
+        """Forget the revalidation cache so the next list_tools refetches the catalog."""
+        self._tools_cache.clear()
+
     async def list_tools(self) -> List[Dict[str, Any]]:
         """Get list of available tools from the server."""
         if not self.is_connected:
@@ -270,7 +513,7 @@ class HttpMCPServer:
     async def _list_tools_langchain(self) -> List[Dict[str, Any]]:
         """Get tools using langchain adapters."""
         try:
-            tools = await self._langchain_client.get_tools()
+            tools = await self.get_langchain_tools()
             tools_data = []
             
             for tool in tools:
@@ -281,128 +524,177 @@ class HttpMCPServer:
                 }
                 tools_data.append(tool_info)
             
-            logging.info(f"✅ Found {len(tools_data)} tools from {self.name} (langchain)")
+            logging.info("✅ Found %s tools from %s (langchain)", len(tools_data), self.name)
             return tools_data
             
         except Exception as e:
-            logging.error(f"❌ Error listing tools from server {self.name}: {e}")
+            logging.error("❌ Error listing tools from server %s: %s", self.name, e)
             return []
 
     async def _list_tools_aiohttp(self) -> List[Dict[str, Any]]:
         """Get tools using custom aiohttp implementation."""
-        if not self.session:
-            raise RuntimeError(f"Session not initialized for {self.name}")
+        session = self._get_session()
         
         try:
-            # Try different tool endpoints
-            tool_endpoints = ["/tools", "/api/tools", "/mcp/tools"]
+            # Serve a cached list without any request while Cache-Control says it is fresh
+            now = time.monotonic()
+            for _, _, cached_tools, fresh_until in self._tools_cache.values():
+                if now < fresh_until:
+                    logging.info("📋 Using cached tools list for %s", self.name)
+                    return cached_tools
             
-            for endpoint in tool_endpoints:
+            # Try different tool endpoints, unless the server is known to speak only MCP
+            candidates = () if self._use_mcp_protocol else self._remembered_first(self._list_urls, self._list_endpoint)
+            for endpoint, tools_url in candidates:
                 try:
-                    tools_url = urljoin(self.base_url, endpoint)
-                    headers = {}
-                    if self.mcp_session_id:
-                        headers['mcp-session-id'] = self.mcp_session_id
+                    headers = self._request_headers
+                    
+                    cached = self._tools_cache.get(tools_url)
+                    if cached:
+                        headers = dict(headers)
+                        etag, last_modified = cached[0], cached[1]
+                        if etag:
+                            headers['If-None-Match'] = etag
+                        if last_modified:
+                            headers['If-Modified-Since'] = last_modified
                     
-                    logging.info(f"🔍 Trying to get tools from {self.name} at: {tools_url}")
-                    async with self.session.get(tools_url, headers=headers) as response:
-                        logging.info(f"📡 Response from {tools_url}: Status {response.status}")
+                    logging.info("🔍 Trying to get tools from %s at: %s", self.name, tools_url)
+                    async with session.get(tools_url, headers=headers, **self._request_options) as response:
+                        logging.info("📡 Response from %s: Status %s", tools_url, response.status)
                         
-                        if response.status == 200:
-                            tools_data = await response.json()
-                            logging.info(f"📋 Tools data received from {self.name}: {tools_data}")
+                        if response.status == 304 and cached:
+                            self._list_endpoint = (endpoint, tools_url)
+                            logging.info("✅ Tools list from %s not modified, using cache", self.name)
+                            self._tools_cache[tools_url] = (
+                                response.headers.get('etag', cached[0]),
+                                response.headers.get('last-modified', cached[1]),
+                                cached[2],
+                                _fresh_until(response.headers.get('cache-control')),
+                            )
+                            return cached[2]
+                        elif response.status == 200:
+                            tools_data = await _read_json(response)
+                            logging.debug("📋 Tools data received from %s: %s", self.name, tools_data)
                             
                             if isinstance(tools_data, dict) and 'tools' in tools_data:
                                 tools_list = tools_data['tools']
-                                logging.info(f"✅ Found {len(tools_list)} tools in 'tools' field from {self.name}")
-                                return tools_list
+                                logging.info("✅ Found %s tools in 'tools' field from %s", len(tools_list), self.name)
                             elif isinstance(tools_data, list):
-                                logging.info(f"✅ Found {len(tools_data)} tools in list from {self.name}")
-                                return tools_data
+                                tools_list = tools_data
+                                logging.info("✅ Found %s tools in list from %s", len(tools_data), self.name)
                             else:
-                                logging.warning(f"⚠️ Unexpected tools data format from {self.name}: {type(tools_data)}")
+                                logging.warning("⚠️ Unexpected tools data format from %s: %s", self.name, type(tools_data))
                                 return []
+                            
+                            etag = response.headers.get('etag')
+                            last_modified = response.headers.get('last-modified')
+                            fresh_until = _fresh_until(response.headers.get('cache-control'))
+                            if etag or last_modified or fresh_until:
+                                self._tools_cache[tools_url] = (etag, last_modified, tools_list, fresh_until)
+                            self._list_endpoint = (endpoint, tools_url)
+                            return tools_list
                         elif response.status == 404:
-                            logging.info(f"❌ Endpoint {endpoint} not found (404) for {self.name}")
-                            continue  # Try next endpoint
+                            logging.info("❌ Endpoint %s not found (404) for %s", endpoint, self.name)
                         else:
                             response_text = await response.text()
-                            logging.warning(f"⚠️ Unexpected response from {self.name} at {endpoint}: {response.status} - {response_text}")
-                            continue
+                            logging.warning("⚠️ Unexpected response from %s at %s: %s - %s", self.name, endpoint, response.status, response_text)
                 except Exception as e:
-                    logging.error(f"❌ Error trying endpoint {endpoint} for {self.name}: {e}")
-                    continue
+                    logging.error("❌ Error trying endpoint %s for %s: %s", endpoint, self.name, e)
+                
+                # This endpoint did not work; forget it if it was the remembered one
+                if self._list_endpoint == (endpoint, tools_url):
+                    self._list_endpoint = None
             
             # If no tools endpoint found, try MCP protocol
-            logging.info(f"🔍 Trying MCP protocol for {self.name} at: {self.base_url}")
+            logging.info("🔍 Trying MCP protocol for %s at: %s", self.name, self.base_url)
             try:
-                mcp_request = {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "tools/list",
-                    "params": {}
-                }
-                
-                headers = {}
-                if self.mcp_session_id:
-                    headers['mcp-session-id'] = self.mcp_session_id
+                mcp_request = self._mcp_request("tools/list", {})
                 
-                logging.info(f"📡 Sending MCP request to {self.name}: {mcp_request}")
-                async with self.session.post(self.base_url, json=mcp_request, headers=headers) as response:
-                    logging.info(f"📡 MCP response from {self.name}: Status {response.status}")
+                logging.debug("📡 Sending MCP request to %s: %s", self.name, mcp_request)
+                async with session.post(self.base_url, json=mcp_request, headers=self._request_headers, **self._request_options) as response:
+                    logging.info("📡 MCP response from %s: Status %s", self.name, response.status)
                     
                     if response.status == 200:
-                        result = await response.json()
-                        logging.info(f"📋 MCP response data from {self.name}: {result}")
+                        result = await _read_json(response)
+                        logging.debug("📋 MCP response data from %s: %s", self.name, result)
                         
                         tools = result.get('result', {}).get('tools', [])
-                        logging.info(f"✅ Found {len(tools)} tools via MCP protocol from {self.name}")
+                        self._use_mcp_protocol = True
+                        logging.info("✅ Found %s tools via MCP protocol from %s", len(tools), self.name)
                         return tools
                     else:
                         response_text = await response.text()
-                        logging.warning(f"⚠️ MCP protocol failed for {self.name}: {response.status} - {response_text}")
+                        logging.warning("⚠️ MCP protocol failed for %s: %s - %s", self.name, response.status, response_text)
+                        self._use_mcp_protocol = False
                         return []
             except Exception as e:
-                logging.error(f"❌ MCP protocol error for {self.name}: {e}")
+                logging.error("❌ MCP protocol error for %s: %s", self.name, e)
+                self._use_mcp_protocol = False
                 return []
                     
         except Exception as e:
-            logging.error(f"❌ Error listing tools from server {self.name}: {e}")
+            logging.error("❌ Error listing tools from server %s: %s", self.name, e)
             return []
 
     def is_initialized(self) -> bool:
         """Check if the server is initialized."""
         return self.is_connected and (self.session is not None or self._langchain_client is not None)
 
+    async def close_session(self) -> None:
+        """Close this server's private HTTP session; the next call reopens one."""
+        session = self.session
+        if session is not None and session is not self._shared_session and not session.closed:
+            await session.close()
+
     async def cleanup(self) -> None:
         """Clean up server resources."""
-        async with self._cleanup_lock:
-            try:
-                if self.session:
-                    await self.exit_stack.aclose()
-                    self.session = None
-                
-                if self._langchain_client:
-                    self._langchain_client = None
-                
-                self.is_connected = False
-                self.mcp_session_id = None
-                logging.info(f"🧹 HTTP/SSE Server {self.name} cleaned up")
-            except Exception as e:
-                logging.error(f"❌ Error during cleanup of {self.name}: {e}")
+        if self._cleaned:
+            await self._cleanup_done.wait()
+            return
+        
+        self._cleaned = True
+        try:
+            if self.session:
+                # A session shared by the studio is closed by the studio
+                if self.session is not self._shared_session:
+                    await self.session.close()
+                self.session = None
+                self._tools_cache.clear()
+                self._tool_endpoint = None
+                self._list_endpoint = None
+                self._use_mcp_protocol = False
+            
+            if self._langchain_client:
+                self._langchain_client = None
+                self._langchain_tools = []
+                self._tool_index = {}
+            
+            self.is_connected = False
+            self.mcp_session_id = None
+            logging.info(f"🧹 HTTP/SSE Server {self.name} cleaned up")
+        except Exception as e:
+            logging.error(f"❌ Error during cleanup of {self.name}: {e}")
+        finally:
+            self._cleanup_done.set()
 
 
 class HttpMCPStudio:
     """Studio for managing multiple HTTP/SSE MCP servers."""
     
+    __slots__ = ('servers', '_by_name', '_session')
+    
     def __init__(self):
         self.servers: List[HttpMCPServer] = []
+        self._by_name: Dict[str, HttpMCPServer] = {}
+        # One pooled session shared by every aiohttp-backed server
+        self._session: Optional[aiohttp.ClientSession] = None
         
     def add_server(self, name: str, server_config: Dict[str, Any]) -> None:
         """Add a new HTTP/SSE MCP server."""
         try:
             server = HttpMCPServer(name, server_config)
             self.servers.append(server)
+            self._by_name.setdefault(name, server)
             logging.info(f"✅ Added HTTP/SSE server: {name}")
         except ValidationError as e:
             logging.error(f"❌ Invalid config for server {name}: {e}")
@@ -413,48 +705,100 @@ class HttpMCPStudio:
         if "mcpServers" not in config_data:
             return
             
-        for name, srv_config in config_data["mcpServers"].items():
+        filtered = {
+            name: srv_config
+            for name, srv_config in config_data["mcpServers"].items()
+            if isinstance(srv_config, dict)
+            and str(srv_config.get("transport", "")).lower() in _HTTP_TRANSPORTS
+        }
+        try:
+            validated = _SERVERS_ADAPTER.validate_python(filtered)
+        except ValidationError:
+            # Fall back to per-entry validation so one bad entry doesn't drop the rest
+            validated = {}
+            for name, srv_config in filtered.items():
+                try:
+                    validated[name] = HttpServerConfig.model_validate(srv_config)
+                except ValidationError as e:
+                    logging.error(f"❌ Error loading server {name}: {e}")
+        
+        for name, server_cfg in validated.items():
             try:
-                transport = srv_config.get("transport", "").lower()
-                if transport in ["http", "sse", "streamable_http"]:
-                    self.add_server(name, srv_config)
+                self.add_server(name, server_cfg)
             except Exception as e:
                 logging.error(f"❌ Error loading server {name}: {e}")
     
     async def initialize_all_servers(self) -> None:
-        """Initialize all HTTP/SSE servers."""
-        for server in self.servers:
-            try:
-                await server.initialize()
-            except Exception as e:
-                logging.error(f"❌ Failed to initialize server {server.name}: {e}")
+        """Initialize all HTTP/SSE servers concurrently."""
+        servers = list(self.servers)
+        
+        if any(server.config.transport.lower() == "http" for server in servers):
+            if self._session is None or self._session.closed:
+                self._session = aiohttp.ClientSession(
+                    connector=_make_connector(limit=100),
+                    json_serialize=_json_dumps
+                )
+            for server in servers:
+                server.attach_session(self._session)
+        
+        results = await asyncio.gather(*(server.initialize() for server in servers), return_exceptions=True)
+        for server, result in zip(servers, results):
+            if isinstance(result, Exception):
+                logging.error(f"❌ Failed to initialize server {server.name}: {result}")
     
     async def cleanup_all_servers(self) -> None:
-        """Clean up all HTTP/SSE servers."""
-        for server in reversed(self.servers):
-            try:
-                await server.cleanup()
-            except Exception as e:
-                logging.warning(f"⚠️ Cleanup warning: {e}")
+        """Clean up all HTTP/SSE servers concurrently."""
+        servers = list(reversed(self.servers))
+        results = await asyncio.gather(*(server.cleanup() for server in servers), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logging.warning(f"⚠️ Cleanup warning: {result}")
+        
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    async def close_sessions(self) -> None:
+        """Close pooled HTTP sessions without disconnecting the servers.
+        
+        Servers stay initialized and reopen a private session on their next call.
+        """
+        await asyncio.gather(*(server.close_session() for server in self.servers), return_exceptions=True)
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
     
     def get_initialized_servers(self) -> List[HttpMCPServer]:
         """Get list of initialized HTTP/SSE servers."""
         return [server for server in self.servers if server.is_initialized()]
     
+    def get_server_by_name(self, name: str) -> Optional[HttpMCPServer]:
+        """Get server by name."""
+        return self._by_name.get(name)
+    
     async def get_all_tools(self) -> Dict[str, List[Dict[str, Any]]]:
         """Get tools from all initialized HTTP/SSE servers."""
         all_tools = {}
-        for server in self.get_initialized_servers():
-            try:
-                tools = await server.list_tools()
-                all_tools[server.name] = tools
-                logging.info(f"📋 Loaded {len(tools)} tools from {server.name}")
-            except Exception as e:
-                logging.error(f"❌ Error loading tools from {server.name}: {e}")
-                all_tools[server.name] = []
+        servers = self.get_initialized_servers()
+        if not servers:
+            return all_tools
+        
+        names, coros = zip(*((server.name, server.list_tools()) for server in servers))
+        tools_lists = await asyncio.gather(*coros, return_exceptions=True)
+        for name, tools in zip(names, tools_lists):
+            if isinstance(tools, Exception):
+                logging.error(f"❌ Error loading tools from {name}: {tools}")
+                all_tools[name] = []
+            else:
+                all_tools[name] = tools
+                logging.info(f"📋 Loaded {len(tools)} tools from {name}")
         return all_tools
 
 
 def get_supported_transports() -> List[str]:
-    """Get list of supported transport types."""
+    """Get list of supported transport types.
+    
+    All transports run on asyncio; when uvloop is installed this module
+    switches new event loops to it on import.
+    """
     return ["http", "sse", "streamable_http"] 
\ No newline at end of file
@@ -5,21 +5,42 @@ This module handles MCP server connections, configurations, and management.
 """
 
 import asyncio
-import json
+import functools
 import logging
 import os
 import shutil
 from contextlib import AsyncExitStack
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
+import orjson
 from dotenv import load_dotenv
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+
+
+# shutil.which results; PATH is scanned once per command name per process
+_WHICH_CACHE: Dict[str, Optional[str]] = {}
+
+
+def _which(command: str) -> Optional[str]:
+    """Memoized shutil.which."""
+    if command not in _WHICH_CACHE:
+        _WHICH_CACHE[command] = shutil.which(command)
+    return _WHICH_CACHE[command]
+
+
+@functools.lru_cache(maxsize=32)
+def _read_config(file_path: str, mtime_ns: int, size: int) -> bytes:
+    """Read a config file's raw bytes; keyed on mtime and size so edits are picked up."""
+    with open(file_path, "rb") as f:
+        return f.read()
 
 
 class ServerConfig(BaseModel):
     """Pydantic model for server configuration."""
+    model_config = ConfigDict(frozen=True)
+    
     transport: str = Field(default="stdio", description="Transport type (stdio or http)")
     command: Optional[str] = Field(None, description="Command to start the server (stdio only)")
     args: Optional[List[str]] = Field(None, description="Arguments for the server command (stdio only)")
@@ -27,6 +48,10 @@ class ServerConfig(BaseModel):
     url: Optional[str] = Field(None, description="URL for HTTP servers")
 
 
+# Validates a whole ``mcpServers`` mapping in one pass instead of per entry.
+_SERVERS_ADAPTER = TypeAdapter(Dict[str, ServerConfig])
+
+
 class Configuration:
     """Manages configuration and environment variables for the MCP client."""
 
@@ -46,6 +71,9 @@ class Configuration:
     def load_config(file_path: str) -> Dict[str, Any]:
         """Load server configuration from JSON file.
 
+        File contents are cached until they change on disk; each call parses
+        them into a fresh dict the caller may modify.
+
         Args:
             file_path: Path to the JSON configuration file.
 
@@ -56,8 +84,8 @@ class Configuration:
             FileNotFoundError: If configuration file doesn't exist.
             JSONDecodeError: If configuration file is invalid JSON.
         """
-        with open(file_path, "r") as f:
-            return json.load(f)
+        st = os.stat(file_path)
+        return orjson.loads(_read_config(os.path.abspath(file_path), st.st_mtime_ns, st.st_size))
 
     @property
     def llm_api_key(self) -> str:
@@ -118,29 +146,36 @@ class Configuration:
 class MCPServer:
     """Manages MCP server connections and tool execution."""
 
-    def __init__(self, name: str, config: Dict[str, Any]) -> None:
+    __slots__ = ('name', 'config', 'stdio_context', 'session', '_cleaned', '_cleanup_done', 'exit_stack')
+
+    def __init__(self, name: str, config: Union[Dict[str, Any], ServerConfig]) -> None:
         self.name: str = name
-        # Validate config using Pydantic
+        # Validate config using Pydantic (already-validated models pass straight through)
         try:
-            self.config = ServerConfig(**config)
+            self.config = ServerConfig.model_validate(config)
         except ValidationError as e:
             logging.error(f"Invalid server configuration for {name}: {e}")
             raise
         
         self.stdio_context: Any | None = None
         self.session: ClientSession | None = None
-        self._cleanup_lock: asyncio.Lock = asyncio.Lock()
+        # Cleanup runs once; concurrent callers just wait for it to finish
+        self._cleaned: bool = False
+        self._cleanup_done: asyncio.Event = asyncio.Event()
         self.exit_stack: AsyncExitStack = AsyncExitStack()
 
     async def initialize(self) -> None:
         """Initialize the server connection."""
+        self._cleaned = False
+        self._cleanup_done = asyncio.Event()
+        
         if self.config.transport != "stdio":
             raise ValueError(f"Server {self.name} uses {self.config.transport} transport, but only stdio is supported")
         
         if not self.config.command:
             raise ValueError(f"Server {self.name} requires a command for stdio transport")
             
-        command = shutil.which("npx") if self.config.command == "npx" else self.config.command
+        command = _which("npx") if self.config.command == "npx" else self.config.command
         if command is None:
             raise ValueError("The command must be a valid string and cannot be None.")
 
@@ -163,14 +198,20 @@ class MCPServer:
 
     async def cleanup(self) -> None:
         """Clean up server resources."""
-        async with self._cleanup_lock:
-            try:
-                await self.exit_stack.aclose()
-                self.session = None
-                self.stdio_context = None
-                logging.info(f"🧹 Server {self.name} cleaned up")
-            except Exception as e:
-                logging.error(f"❌ Error during cleanup of server {self.name}: {e}")
+        if self._cleaned:
+            await self._cleanup_done.wait()
+            return
+        
+        self._cleaned = True
+        try:
+            await self.exit_stack.aclose()
+            self.session = None
+            self.stdio_context = None
+            logging.info(f"🧹 Server {self.name} cleaned up")
+        except Exception as e:
+            logging.error(f"❌ Error during cleanup of server {self.name}: {e}")
+        finally:
+            self._cleanup_done.set()
 
     def is_initialized(self) -> bool:
         """Check if the server is initialized."""
@@ -180,20 +221,25 @@ class MCPServer:
 class MCPStudio:
     """Studio for managing multiple MCP servers."""
     
+    __slots__ = ('config', 'servers', '_by_name')
+    
     def __init__(self, config: Configuration):
         self.config = config
         self.servers: List[MCPServer] = []
+        self._by_name: Dict[str, MCPServer] = {}
         
-    def add_server(self, name: str, server_config: Dict[str, Any]) -> None:
+    def add_server(self, name: str, server_config: Union[Dict[str, Any], ServerConfig]) -> None:
         """Add a new MCP server to the studio.
         
         Args:
             name: Name of the server
-            server_config: Server configuration dictionary
+            server_config: Server configuration dictionary or validated ServerConfig
         """
         try:
             server = MCPServer(name, server_config)
             self.servers.append(server)
+            # First server registered under a name wins, as with the old linear scan
+            self._by_name.setdefault(name, server)
             logging.info(f"✅ Added server: {name}")
         except ValidationError as e:
             logging.error(f"❌ Invalid config for server {name}: {e}")
@@ -207,19 +253,28 @@ class MCPStudio:
         """
         server_config = self.config.load_config(config_file)
         
-        for name, srv_config in server_config["mcpServers"].items():
-            try:
-                server_cfg = ServerConfig(**srv_config)
-                if server_cfg.transport == "stdio":
-                    self.add_server(name, srv_config)
-                else:
-                    logging.warning(f"⚠️ Skipping {server_cfg.transport} server: {name} (only stdio supported)")
-            except ValidationError as e:
-                logging.error(f"❌ Invalid config for server {name}: {e}")
-                continue
+        servers = server_config["mcpServers"]
+        try:
+            validated = _SERVERS_ADAPTER.validate_python(servers)
+        except ValidationError:
+            # Fall back to per-entry validation so one bad entry doesn't drop the rest
+            validated = {}
+            for name, srv_config in servers.items():
+                try:
+                    validated[name] = ServerConfig.model_validate(srv_config)
+                except ValidationError as e:
+                    logging.error(f"❌ Invalid config for server {name}: {e}")
+        
+        for name, server_cfg in validated.items():
+            if server_cfg.transport == "stdio":
+                self.add_server(name, server_cfg)
+            else:
+                logging.warning(f"⚠️ Skipping {server_cfg.transport} server: {name} (only stdio supported)")
     
     async def initialize_all_servers(self) -> None:
         """Initialize all servers."""
+        # Kept sequential: stdio_client and ClientSession open anyio task groups,
+        # which must be closed from the same task that entered them in cleanup()
         for server in self.servers:
             try:
                 await server.initialize()
@@ -242,10 +297,7 @@ class MCPStudio:
     
     def get_server_by_name(self, name: str) -> Optional[MCPServer]:
         """Get server by name."""
-        for server in self.servers:
-            if server.name == name:
-                return server
-        return None
+        return self._by_name.get(name)
 
 
 
@@ -5,18 +5,96 @@ This module handles loading tools from MCP servers and custom tools,
 managing tool execution, and providing a unified interface for tools.
 """
 
+import asyncio
+import hashlib
+import inspect
 import logging
-from typing import Any, List, Dict, Optional
+import os
+import queue
+import sys
+import threading
+import time
+from typing import Any, List, Dict, Optional, Tuple, Union
 from datetime import datetime
 import json
 import functools
+from collections import OrderedDict
+from enum import Enum
 
-from langchain_mcp_adapters.tools import load_mcp_tools
-from pydantic import BaseModel, Field, ValidationError
+import orjson
+from langchain.tools import BaseTool
+from langchain_mcp_adapters.tools import convert_mcp_tool_to_langchain_tool
+from mcp.types import Tool as McpTool
+from pydantic import (
+    BaseModel, ConfigDict, Field, PrivateAttr, StrictBool, StrictFloat, StrictInt, StrictStr,
+    TypeAdapter, ValidationError, create_model
+)
 
 from chat.utils.mcp_studio import MCPStudio, MCPServer
 from chat.utils.mcp_see_http import HttpMCPStudio, HttpMCPServer
 
+logger = logging.getLogger(__name__)
+
+
+# On-disk catalog of discovered stdio tools, keyed by _catalog_key(server)
+_DISCOVERY_CACHE_PATH = os.getenv(
+    "MCP_DISCOVERY_CACHE",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), ".mcp_discovery_cache.json")
+)
+
+# Bumped when the shape of cached tool entries changes, so older entries miss
+_CATALOG_FORMAT = b"2"
+
+# Seconds a cached catalog is trusted before the server is asked again
+_DISCOVERY_TTL = float(os.getenv("MCP_DISCOVERY_TTL", "3600"))
+
+
+# Marks a tool whose argument validator has not been built yet
+_UNBUILT = object()
+
+# How many recent (tool, arguments) approvals are remembered
+_APPROVAL_CACHE_SIZE = 5
+
+
+def _dispatch_kind(tool: Any) -> Optional[str]:
+    """Classify how a tool is invoked, so execution doesn't re-probe it every call."""
+    # For langchain tools, prefer the invoke family, then the legacy run family
+    if hasattr(tool, 'invoke'):
+        return "ainvoke" if hasattr(tool, 'ainvoke') else "invoke"
+    if hasattr(tool, 'run'):
+        return "arun" if hasattr(tool, 'arun') else "run"
+    if callable(tool):
+        return "acall" if inspect.iscoroutinefunction(tool) else "call"
+    return None
+
+
+async def _list_mcp_tools(session: Any) -> List[McpTool]:
+    """List every tool an MCP session offers, following pagination cursors."""
+    tools: List[McpTool] = []
+    cursor = None
+    while True:
+        page = await session.list_tools(cursor=cursor)
+        tools.extend(page.tools or ())
+        if not page.nextCursor:
+            return tools
+        cursor = page.nextCursor
+
+
+def _catalog_key(server: Union[MCPServer, HttpMCPServer]) -> str:
+    """Hash a server's name and config so a cached catalog goes stale when either changes."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(_CATALOG_FORMAT)
+    digest.update(server.name.encode())
+    digest.update(server.config.model_dump_json().encode())
+    
+    # Stdio servers usually run a local script; fold in its mtime so edits refresh the catalog
+    config = server.config
+    for part in [getattr(config, 'command', None), *(getattr(config, 'args', None) or [])]:
+        if part and os.path.isfile(part):
+            digest.update(str(os.stat(part).st_mtime_ns).encode())
+    
+    return digest.hexdigest()
+
 
 class ToolCall(BaseModel):
     """Pydantic model for validating tool calls."""
@@ -34,75 +112,264 @@ class ToolResult(BaseModel):
     timestamp: Optional[datetime] = Field(default_factory=datetime.now, description="Timestamp of the result")
 
 
+class Category(str, Enum):
+    """Tool categories; a str subclass, so members still compare equal to their values."""
+    MCP = "mcp"
+    HTTP = "http"
+    CUSTOM = "custom"
+    SEE = "see"
+    UNKNOWN = "unknown"
+    
+    # Format as the plain value; Python 3.11+ would otherwise give "Category.MCP"
+    __str__ = str.__str__
+    __format__ = str.__format__
+
+
+# Lower wins when several sources register the same tool name, as the old
+# mcp -> http -> custom -> see scan did
+_SOURCE_PRIORITY = {Category.MCP: 0, Category.HTTP: 1, Category.CUSTOM: 2, Category.SEE: 3, Category.UNKNOWN: 4}
+
+TOOL_CALL_ADAPTER = TypeAdapter(ToolCall)
+
+# JSON-schema primitive types mapped to the Python types pydantic validates against.
+# Scalars are strict so True is not taken as an integer nor "yes" as a boolean.
+_JSON_SCHEMA_TYPES = {
+    "string": StrictStr,
+    "integer": StrictInt,
+    "number": StrictFloat,
+    "boolean": StrictBool,
+    "array": list,
+    "object": dict,
+}
+
+
+def _build_args_adapter(tool_name: str, schema: Any) -> Optional[TypeAdapter]:
+    """Build an argument validator from a tool's JSON schema, or None if it has none.
+    
+    Only top-level property types and required-ness are checked; extra arguments are
+    allowed through, since the tool itself remains the final authority.
+    """
+    if not isinstance(schema, dict) or not isinstance(schema.get("properties"), dict):
+        return None
+    
+    required = set(schema.get("required") or ())
+    fields = {}
+    for i, (name, spec) in enumerate(schema["properties"].items()):
+        if not isinstance(name, str):
+            return None
+        json_type = spec.get("type") if isinstance(spec, dict) else None
+        py_type = _JSON_SCHEMA_TYPES.get(json_type, Any) if isinstance(json_type, str) else Any
+        # Every field is declared under a safe Python name and validated by its alias, so
+        # names like "json", "_id" or "model_x" neither shadow BaseModel nor get dropped
+        default = ... if name in required else None
+        annotation = py_type if name in required else Optional[py_type]
+        fields[f"field_{i}"] = (annotation, Field(default, alias=name))
+    
+    try:
+        model = create_model(
+            f"{tool_name}Args",
+            __config__=ConfigDict(extra="allow", populate_by_name=True),
+            **fields
+        )
+    except Exception as e:
+        logger.debug("Could not build argument validator for %s: %s", tool_name, e)
+        return None
+    return TypeAdapter(model)
+
+
+def _tool_parameters(tool: Any) -> Dict[str, Any]:
+    """Return a tool's argument JSON schema, or {} if it does not publish one.
+    
+    LangChain tools carry it as args_schema (a dict for MCP-adapted tools, a
+    pydantic model for @tool functions) rather than a parameters attribute.
+    """
+    parameters = getattr(tool, 'parameters', None)
+    if isinstance(parameters, dict) and parameters:
+        return parameters
+    args_schema = getattr(tool, 'args_schema', None)
+    if isinstance(args_schema, dict):
+        return args_schema
+    try:
+        return tool.tool_call_schema.model_json_schema()
+    except Exception:
+        return {}
+
+
 class ToolInfo(BaseModel):
     """Information about a tool."""
     name: str = Field(..., description="Tool name")
     description: str = Field(..., description="Tool description")
     source: str = Field(..., description="Source of the tool (mcp_server:name, custom, or see)")
     parameters: Dict[str, Any] = Field(default_factory=dict, description="Tool parameters")
-    category: str = Field(default="unknown", description="Tool category (mcp, custom, see)")
+    category: Category = Field(default=Category.UNKNOWN, description="Tool category (mcp, http, custom, see)")
+    cacheable: bool = Field(default=False, description="Whether results can be reused for identical arguments")
+    ttl: float = Field(default=300.0, description="Seconds a cached result stays valid")
+
+
+class _StdinReader:
+    """One long-lived daemon thread that reads stdin lines with plain input().
+    
+    Each request is answered by the next line typed. A request whose awaiting task
+    was cancelled (Ctrl+C, a timeout, a gather cancel) while its input() was pending
+    passes that line on to the oldest request still waiting, instead of an orphaned
+    reader thread swallowing it. Being a daemon, the thread never holds up loop
+    shutdown or interpreter exit.
+    """
+    
+    def __init__(self) -> None:
+        self._requests: "queue.Queue[Tuple[str, asyncio.AbstractEventLoop, asyncio.Future]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        # Future of the request whose input() is currently blocked, if any
+        self._current: Optional[asyncio.Future] = None
+    
+    def read_line(self, prompt: str) -> "asyncio.Future[str]":
+        """Queue a prompt and return a future resolved with the line typed for it."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            if self._current is not None and self._current.done():
+                # input() is still blocked for a cancelled prompt; show this prompt ourselves
+                print(prompt, end="", flush=True)
+                prompt = ""
+            self._requests.put((prompt, loop, future))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="stdin-reader", daemon=True)
+                self._thread.start()
+        return future
+    
+    def _next_waiting(self):
+        """Pop requests until one whose future is still pending; None if there is none."""
+        while True:
+            try:
+                request = self._requests.get_nowait()
+            except queue.Empty:
+                return None
+            if not request[2].done():
+                return request
+    
+    def _run(self) -> None:
+        # Keep stdin referenced from this frame: a daemon thread blocked in input() holds
+        # the stream's lock, and freeing the stream at interpreter exit would abort
+        stdin = sys.stdin  # noqa: F841
+        while True:
+            prompt, loop, future = self._requests.get()
+            if future.done():
+                continue
+            with self._lock:
+                self._current = future
+            try:
+                outcome = ("result", input(prompt))
+            except BaseException as e:
+                outcome = ("exception", e)
+            with self._lock:
+                self._current = None
+                if future.done():
+                    request = self._next_waiting()
+                    if request is None:
+                        continue
+                    _, loop, future = request
+            try:
+                loop.call_soon_threadsafe(self._resolve, future, outcome)
+            except RuntimeError:
+                pass  # Loop already closed
+    
+    @staticmethod
+    def _resolve(future: asyncio.Future, outcome: Tuple[str, Any]) -> None:
+        if future.done():
+            return
+        if outcome[0] == "result":
+            future.set_result(outcome[1])
+        else:
+            future.set_exception(outcome[1])
+
+
+_STDIN_READER = _StdinReader()
+
+
+def _truncate(value: Any, limit: int) -> str:
+    """str() a value, cutting it at limit characters."""
+    text = str(value)
+    return text[:limit] + '...' if len(text) > limit else text
+
+
+def _format_call_args(args: tuple, kwargs: Dict[str, Any]) -> str:
+    """Format call arguments for the execution log."""
+    combined_args = []
+    if args:
+        combined_args.append(f"args=({', '.join(_truncate(arg, 100) for arg in args)})")
+    if kwargs:
+        combined_args.append(f"kwargs=({{{', '.join(f'{k}={_truncate(v, 100)}' for k, v in kwargs.items())}}})")
+    return ', '.join(combined_args) if combined_args else 'None'
 
 
 def log_tool_execution(tool_name: str, original_func):
     """Decorator to log tool execution details."""
     @functools.wraps(original_func)
     def wrapper(*args, **kwargs):
-        # Format arguments for logging
-        args_str = ', '.join([str(arg)[:100] + '...' if len(str(arg)) > 100 else str(arg) for arg in args])
-        kwargs_str = ', '.join([f"{k}={str(v)[:100] + '...' if len(str(v)) > 100 else str(v)}" for k, v in kwargs.items()])
-        
-        combined_args = []
-        if args_str:
-            combined_args.append(f"args=({args_str})")
-        if kwargs_str:
-            combined_args.append(f"kwargs=({{{kwargs_str}}})")
-        
-        logging.info(f"🔧 LLM Tool Execution: {tool_name}")
-        logging.info(f"📝 Parameters: {', '.join(combined_args) if combined_args else 'None'}")
+        # Only pay for formatting the arguments and result when INFO is on
+        verbose = logger.isEnabledFor(logging.INFO)
+        if verbose:
+            logger.info("🔧 LLM Tool Execution: %s", tool_name)
+            logger.info("📝 Parameters: %s", _format_call_args(args, kwargs))
         
         try:
             result = original_func(*args, **kwargs)
-            result_str = str(result)[:200] + '...' if len(str(result)) > 200 else str(result)
-            logging.info(f"✅ Tool '{tool_name}' completed successfully")
-            logging.info(f"📊 Result: {result_str}")
+            if verbose:
+                logger.info("✅ Tool '%s' completed successfully", tool_name)
+                logger.info("📊 Result: %s", _truncate(result, 200))
             return result
         except Exception as e:
-            logging.error(f"❌ Tool '{tool_name}' failed: {str(e)}")
+            logger.error("❌ Tool '%s' failed: %s", tool_name, e)
             raise
     
     @functools.wraps(original_func)
     async def async_wrapper(*args, **kwargs):
-        # Format arguments for logging
-        args_str = ', '.join([str(arg)[:100] + '...' if len(str(arg)) > 100 else str(arg) for arg in args])
-        kwargs_str = ', '.join([f"{k}={str(v)[:100] + '...' if len(str(v)) > 100 else str(v)}" for k, v in kwargs.items()])
-        
-        combined_args = []
-        if args_str:
-            combined_args.append(f"args=({args_str})")
-        if kwargs_str:
-            combined_args.append(f"kwargs=({{{kwargs_str}}})")
-        
-        logging.info(f"🔧 LLM Tool Execution: {tool_name}")
-        logging.info(f"📝 Parameters: {', '.join(combined_args) if combined_args else 'None'}")
+        verbose = logger.isEnabledFor(logging.INFO)
+        if verbose:
+            logger.info("🔧 LLM Tool Execution: %s", tool_name)
+            logger.info("📝 Parameters: %s", _format_call_args(args, kwargs))
         
         try:
             result = await original_func(*args, **kwargs)
-            result_str = str(result)[:200] + '...' if len(str(result)) > 200 else str(result)
-            logging.info(f"✅ Tool '{tool_name}' completed successfully")
-            logging.info(f"📊 Result: {result_str}")
+            if verbose:
+                logger.info("✅ Tool '%s' completed successfully", tool_name)
+                logger.info("📊 Result: %s", _truncate(result, 200))
             return result
         except Exception as e:
-            logging.error(f"❌ Tool '{tool_name}' failed: {str(e)}")
+            logger.error("❌ Tool '%s' failed: %s", tool_name, e)
             raise
     
     # Return appropriate wrapper based on whether the function is async
-    import asyncio
     if asyncio.iscoroutinefunction(original_func):
         return async_wrapper
     else:
         return wrapper
 
 
+class _HttpMCPTool(BaseTool):
+    """LangChain tool that forwards calls to one tool on an HTTP MCP server."""
+    _server: Any = PrivateAttr()
+    _tool_name: str = PrivateAttr()
+    
+    def __init__(self, server: HttpMCPServer, tool_name: str, **kwargs: Any) -> None:
+        super().__init__(name=tool_name, **kwargs)
+        self._server = server
+        self._tool_name = tool_name
+    
+    def _run(self, **kwargs) -> str:
+        """Synchronous run method."""
+        raise NotImplementedError("Use async version")
+    
+    async def _arun(self, **kwargs) -> str:
+        """Asynchronous run method."""
+        try:
+            result = await self._server.call_tool(self._tool_name, kwargs)
+            return str(result)
+        except Exception as e:
+            return f"Error executing HTTP tool {self._tool_name}: {e}"
+
+
 def wrap_tool_with_logging(tool):
     """Wrap a LangChain tool with execution logging."""
     if not hasattr(tool, 'name'):
@@ -136,7 +403,9 @@ def wrap_tool_with_logging(tool):
 class ToolsManager:
     """Manages tools from MCP servers and custom tools."""
     
-    def __init__(self, mcp_studio: MCPStudio, http_mcp_studio: Optional[HttpMCPStudio] = None):
+    def __init__(self, mcp_studio: MCPStudio, http_mcp_studio: Optional[HttpMCPStudio] = None,
+                 discovery_cache_path: Optional[str] = None, result_cache_size: int = 256,
+                 discovery_ttl: float = _DISCOVERY_TTL):
         self.mcp_studio = mcp_studio
         self.http_mcp_studio = http_mcp_studio or HttpMCPStudio()
         self.mcp_tools: List[Any] = []
@@ -145,13 +414,45 @@ class ToolsManager:
         self.see_tools: List[Any] = []
         self.all_tools: List[Any] = []
         self.tool_info: Dict[str, ToolInfo] = {}
+        self._tool_by_name: Dict[str, Any] = {}
+        self._tool_dispatch: Dict[str, Tuple[Any, Optional[str]]] = {}
+        # Source priority of the tool each name currently resolves to
+        self._tool_rank: Dict[str, int] = {}
+        # Per-tool argument validators, built on first call; None means no usable schema
+        self._arg_adapters: Dict[str, Optional[TypeAdapter]] = {}
+        self._tools_dirty: bool = False
+        # Bumped on every catalog change; get_tools_summary is cached against it
+        self._mutation_version: int = 0
+        self._summary_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        self._summary_text: Optional[Tuple[int, str]] = None
+        # (source type, server name or None) per tool, split once at insert time
+        self._source_pair: Dict[str, Tuple[str, Optional[str]]] = {}
         self.approval_enabled: bool = True  # Enable tool approval by default
+        # Sliding window of recently approved (tool, argument hash) pairs
+        self._approval_cache: "OrderedDict[Tuple[str, str], bool]" = OrderedDict()
+        self._approval_lock = asyncio.Lock()
+        # Results of cacheable tools: call key -> (monotonic expiry, result)
+        self._call_cache: "OrderedDict[str, Tuple[float, ToolResult]]" = OrderedDict()
+        self._call_cache_size = result_cache_size
+        # Result-caching opt-ins (cacheable, ttl) by tool name; survive ToolInfo rebuilds on reload
+        self._cache_policy: Dict[str, Tuple[bool, float]] = {}
+        self._discovery_cache_path: str = discovery_cache_path or _DISCOVERY_CACHE_PATH
+        # Catalog key -> {"fetched_at": wall-clock seconds, "tools": [...]}
+        self._discovery_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._discovery_ttl = discovery_ttl
+        self._discovery_dirty: bool = False
+        self._mcp_integrated: bool = False
+        self._http_integrated: bool = False
+        self._mcp_lock = asyncio.Lock()
         
     def set_approval_mode(self, enabled: bool) -> None:
         """Enable or disable tool approval mode."""
         self.approval_enabled = enabled
+        if enabled:
+            # Re-enabling approval should ask again, not replay earlier answers
+            self._approval_cache.clear()
         status = "enabled" if enabled else "disabled"
-        logging.info(f"🔐 Tool approval mode {status}")
+        logger.info("🔐 Tool approval mode %s", status)
         
     def _display_tool_approval_request(self, tool_name: str, arguments: Dict[str, Any], tool_info: ToolInfo) -> None:
         """Display tool approval request with details."""
@@ -164,11 +465,11 @@ class ToolsManager:
         print(f"   1 - ✅ Approve")
         print(f"   2 - ❌ Disapprove")
         
-    def _get_user_approval(self) -> bool:
-        """Get user approval for tool execution."""
+    async def _get_user_approval(self) -> bool:
+        """Get user approval for tool execution without blocking the event loop."""
         while True:
             try:
-                choice = input("\n💬 Enter your choice (1 or 2): ").strip()
+                choice = (await _STDIN_READER.read_line("\n💬 Enter your choice (1 or 2): ")).strip()
                 if choice == "1":
                     print("✅ Tool execution approved!")
                     return True
@@ -177,140 +478,398 @@ class ToolsManager:
                     return False
                 else:
                     print("⚠️ Invalid choice. Please enter 1 (approve) or 2 (disapprove).")
+            except asyncio.CancelledError:
+                # Ctrl+C under asyncio.run cancels the task rather than raising here
+                print("\n❌ Tool execution cancelled by user.")
+                raise
             except KeyboardInterrupt:
                 print("\n❌ Tool execution cancelled by user.")
                 return False
             except Exception as e:
                 print(f"⚠️ Error reading input: {e}")
                 return False
+    
+    @staticmethod
+    def _approval_key(tool_call: ToolCall) -> Tuple[str, str]:
+        """Key an approval by tool name and a hash of its canonical arguments."""
+        arguments = json.dumps(tool_call.arguments, sort_keys=True, default=str)
+        return tool_call.tool, hashlib.blake2b(arguments.encode()).hexdigest()
+    
+    async def _request_approval(self, tool_calls: List[ToolCall]) -> bool:
+        """Ask the user to approve tool calls, skipping ones approved recently.
         
-    async def load_mcp_tools(self) -> None:
-        """Load tools from all initialized MCP servers."""
-        self.mcp_tools = []
+        Prompts are serialized so concurrent calls don't interleave on the terminal.
+        """
+        async with self._approval_lock:
+            pending: Dict[Tuple[str, str], ToolCall] = {}
+            for call in tool_calls:
+                key = self._approval_key(call)
+                if key in self._approval_cache:
+                    self._approval_cache.move_to_end(key)
+                else:
+                    pending.setdefault(key, call)
+            if not pending:
+                logger.info("🔐 Reusing recent approval for %s", ', '.join(call.tool for call in tool_calls))
+                return True
+            
+            calls = list(pending.values())
+            if len(calls) == 1:
+                self._display_tool_approval_request(calls[0].tool, calls[0].arguments, self.tool_info.get(calls[0].tool))
+            else:
+                self._display_batch_approval_request(calls)
+            
+            if not await self._get_user_approval():
+                return False
+            
+            for key in pending:
+                self._approval_cache[key] = True
+                if len(self._approval_cache) > _APPROVAL_CACHE_SIZE:
+                    self._approval_cache.popitem(last=False)
+            return True
+    
+    def _source_lists(self) -> List[Tuple[Category, List[Any]]]:
+        """Tool lists in name-resolution priority order."""
+        return [
+            (Category.MCP, self.mcp_tools),
+            (Category.HTTP, self.http_tools),
+            (Category.CUSTOM, self.custom_tools),
+            (Category.SEE, self.see_tools),
+        ]
+    
+    def _register_tool(self, tool_name: str, tool: Any, category: Category) -> None:
+        """Index a tool by name.
         
-        for server in self.mcp_studio.get_initialized_servers():
+        Name collisions resolve by source (MCP, then HTTP, custom, SEE) whatever the
+        load order, so lazily loaded MCP tools still win over custom tools. Within a
+        source the first registration wins.
+        """
+        rank = _SOURCE_PRIORITY[category]
+        current = self._tool_rank.get(tool_name)
+        if current is None or rank < current:
+            if current is not None:
+                logger.info("🔀 %s tool '%s' takes precedence over an earlier registration", category.value, tool_name)
+            self._tool_by_name[tool_name] = tool
+            self._tool_dispatch[tool_name] = (tool, _dispatch_kind(tool))
+            self._tool_rank[tool_name] = rank
+        self._tools_dirty = True
+        self._mutation_version += 1
+    
+    def _unregister_tools(self, tools: List[Any]) -> None:
+        """Drop tools from the name index before their source list is reloaded.
+        
+        A name that another source also provides falls back to that source's tool.
+        """
+        removed = {id(tool) for tool in tools}
+        for tool in tools:
+            tool_name = getattr(tool, 'name', str(tool))
+            if self._tool_by_name.get(tool_name) is not tool:
+                continue
+            del self._tool_by_name[tool_name]
+            self._tool_dispatch.pop(tool_name, None)
+            self._tool_rank.pop(tool_name, None)
+            for category, source in self._source_lists():
+                fallback = next((t for t in source if id(t) not in removed and getattr(t, 'name', str(t)) == tool_name), None)
+                if fallback is not None:
+                    self._register_tool(tool_name, fallback, category)
+                    break
+        self._tools_dirty = True
+        self._mutation_version += 1
+    
+    def _set_tool_info(self, info: ToolInfo) -> None:
+        """Record a tool's info and the (source type, server name) pair parsed from its source."""
+        policy = self._cache_policy.get(info.name)
+        if policy is not None and policy != (info.cacheable, info.ttl):
+            info = info.model_copy(update={"cacheable": policy[0], "ttl": policy[1]})
+        self.tool_info[info.name] = info
+        self._arg_adapters.pop(info.name, None)
+        source_type, _, server_name = info.source.partition(":")
+        self._source_pair[info.name] = (sys.intern(source_type), sys.intern(server_name) if server_name else None)
+        self._mutation_version += 1
+        
+    def _read_discovery_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Return the discovery cache, reading it from disk on first use."""
+        if self._discovery_cache is None:
             try:
-                tools = await self._load_tools_from_server(server)
-                self.mcp_tools.extend(tools)
-                
-                # Store tool info for each tool
-                for tool in tools:
-                    tool_name = getattr(tool, 'name', str(tool))
-                    self.tool_info[tool_name] = ToolInfo(
-                        name=tool_name,
-                        description=getattr(tool, 'description', 'No description available'),
-                        source=f"mcp_server:{server.name}",
-                        parameters=getattr(tool, 'parameters', {}),
-                        category="mcp"
-                    )
-                    
-            except Exception as e:
-                logging.error(f"❌ Error loading tools from server {server.name}: {e}")
+                with open(self._discovery_cache_path, "rb") as f:
+                    self._discovery_cache = orjson.loads(f.read())
+            except (OSError, orjson.JSONDecodeError):
+                self._discovery_cache = {}
+        return self._discovery_cache
+    
+    def _remember_catalog(self, key: str, catalog: List[Dict[str, Any]]) -> None:
+        """Store a server's tool catalog; empty or non-JSON catalogs are not cached."""
+        if not catalog:
+            return
+        try:
+            orjson.dumps(catalog)
+        except TypeError:
+            return
+        self._read_discovery_cache()[key] = {"fetched_at": time.time(), "tools": catalog}
+        self._discovery_dirty = True
+    
+    def _cached_catalog(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Return a cached catalog, or None if it is missing or older than the TTL."""
+        entry = self._read_discovery_cache().get(key)
+        if not isinstance(entry, dict):
+            return None
+        if time.time() - entry.get("fetched_at", 0) > self._discovery_ttl:
+            return None
+        return entry.get("tools")
+    
+    def _flush_discovery_cache(self) -> None:
+        """Atomically rewrite the discovery cache file if it changed."""
+        if not self._discovery_dirty:
+            return
+        tmp_path = f"{self._discovery_cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps(self._discovery_cache))
+            os.replace(tmp_path, self._discovery_cache_path)
+            self._discovery_dirty = False
+        except OSError as e:
+            logger.warning("⚠️ Could not write tool discovery cache: %s", e)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    
+    def set_tool_cacheable(self, tool_name: str, cacheable: bool = True, ttl: float = 300.0) -> None:
+        """Opt a side-effect-free tool in (or out) of result caching.
+        
+        The choice is kept across tool reloads and also applies to a tool that is
+        only loaded later.
         
-        logging.info(f"🔧 Loaded {len(self.mcp_tools)} MCP tools from {len(self.mcp_studio.get_initialized_servers())} servers")
+        Args:
+            tool_name: Name of the tool
+            cacheable: Whether identical calls may reuse an earlier successful result
+            ttl: Seconds a cached result stays valid
+        """
+        self._cache_policy[tool_name] = (cacheable, ttl)
+        info = self.tool_info.get(tool_name)
+        if info is not None:
+            self._set_tool_info(info)
+    
+    def clear_result_cache(self) -> None:
+        """Drop all cached tool results."""
+        self._call_cache.clear()
     
-    async def load_http_tools(self) -> None:
-        """Load tools from all initialized HTTP/SSE MCP servers."""
+    @staticmethod
+    def _call_key(tool_call: ToolCall) -> str:
+        """Content-address a call by tool name and canonical JSON arguments."""
+        arguments = json.dumps(tool_call.arguments, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.blake2b(f"{tool_call.tool}\0{arguments}".encode()).hexdigest()
+    
+    def invalidate_discovery_cache(self) -> None:
+        """Forget all cached tool catalogs so the next load queries every server."""
+        self._discovery_cache = {}
+        self._discovery_dirty = False
+        try:
+            os.remove(self._discovery_cache_path)
+        except FileNotFoundError:
+            pass
+        logger.info("🗑️ Tool discovery cache invalidated")
+    
+    async def load_mcp_tools(self, force_refresh: bool = False) -> None:
+        """Load tools from all initialized MCP servers.
+        
+        Args:
+            force_refresh: Ignore the discovery cache and query every server
+        """
+        self._unregister_tools(self.mcp_tools)
+        self.mcp_tools = []
+        
+        servers = self.mcp_studio.get_initialized_servers()
+        results = await asyncio.gather(
+            *(self._load_tools_from_server(server, force_refresh) for server in servers),
+            return_exceptions=True
+        )
+        
+        # Register in server order so the tool list stays deterministic
+        for server, tools in zip(servers, results):
+            if isinstance(tools, BaseException):
+                logger.error("❌ Error loading tools from server %s: %s", server.name, tools)
+                continue
+            
+            self.mcp_tools.extend(tools)
+            
+            # Store tool info for each tool
+            for tool in tools:
+                tool_name = getattr(tool, 'name', str(tool))
+                self._register_tool(tool_name, tool, Category.MCP)
+                self._set_tool_info(self._mcp_tool_info(tool_name, tool, server))
+        
+        self._flush_discovery_cache()
+        self._mcp_integrated = True
+        logger.info("🔧 Loaded %s MCP tools from %s servers", len(self.mcp_tools), len(servers))
+    
+    async def load_http_tools(self, force_refresh: bool = False) -> None:
+        """Load tools from all initialized HTTP/SSE MCP servers.
+        
+        Args:
+            force_refresh: Drop each server's revalidation cache and refetch its catalog
+        """
+        self._unregister_tools(self.http_tools)
         self.http_tools = []
         
-        for server in self.http_mcp_studio.get_initialized_servers():
+        servers = self.http_mcp_studio.get_initialized_servers()
+        results = await asyncio.gather(
+            *(self._load_http_server_tools(server, force_refresh) for server in servers),
+            return_exceptions=True
+        )
+        
+        for server, loaded in zip(servers, results):
+            if isinstance(loaded, BaseException):
+                logger.error("❌ Error loading tools from HTTP server %s: %s", server.name, loaded)
+                continue
+            
+            for tool, info in loaded:
+                self.http_tools.append(tool)
+                self._register_tool(getattr(tool, 'name', info.name), tool, Category.HTTP)
+                self._set_tool_info(info)
+        
+        self._http_integrated = True
+        logger.info("🔧 Loaded %s HTTP/SSE tools from %s servers", len(self.http_tools), len(servers))
+
+    async def _ensure_loaded(self) -> None:
+        """Run MCP and HTTP/SSE discovery once, on first use, if nobody loaded them yet."""
+        if self._mcp_integrated and self._http_integrated:
+            return
+        async with self._mcp_lock:
+            pending = []
+            if not self._mcp_integrated:
+                pending.append(self.load_mcp_tools())
+            if not self._http_integrated:
+                pending.append(self.load_http_tools())
+            if pending:
+                await asyncio.gather(*pending)
+
+    async def _find_tool_lazy(self, tool_name: str) -> Optional[Any]:
+        """Look up one tool without full discovery, stopping at the first server that has it.
+        
+        Only the matching tool is registered. Sources that were already loaded in full
+        are skipped, since a miss there is final.
+        """
+        async with self._mcp_lock:
+            tool = self.find_tool_by_name(tool_name)
+            if tool is not None:
+                return tool
+            
             try:
-                transport = server.config.transport.lower()
+                if not self._mcp_integrated:
+                    for server in self.mcp_studio.get_initialized_servers():
+                        for tool in await self._load_tools_from_server(server):
+                            if getattr(tool, 'name', str(tool)) == tool_name:
+                                self.mcp_tools.append(tool)
+                                self._register_tool(tool_name, tool, Category.MCP)
+                                self._set_tool_info(self._mcp_tool_info(tool_name, tool, server))
+                                return tool
                 
-                if transport in ["sse", "streamable_http"]:
-                    # Use langchain adapters for SSE and streamable_http
-                    await self._load_langchain_tools(server)
-                else:
-                    # Use custom aiohttp for regular http
-                    await self._load_aiohttp_tools(server)
-                        
-            except Exception as e:
-                logging.error(f"❌ Error loading tools from HTTP server {server.name}: {e}")
+                if not self._http_integrated:
+                    for server in self.http_mcp_studio.get_initialized_servers():
+                        for tool, info in await self._load_http_server_tools(server):
+                            if getattr(tool, 'name', info.name) == tool_name:
+                                self.http_tools.append(tool)
+                                self._register_tool(tool_name, tool, Category.HTTP)
+                                self._set_tool_info(info)
+                                return tool
+            finally:
+                self._flush_discovery_cache()
+            
+            return None
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP sessions held by the HTTP/SSE servers.
         
-        logging.info(f"🔧 Loaded {len(self.http_tools)} HTTP/SSE tools from {len(self.http_mcp_studio.get_initialized_servers())} servers")
+        Servers stay connected and their tools stay registered; a later call
+        reopens a session. Disconnecting the servers is left to the studio's owner.
+        """
+        await self.http_mcp_studio.close_sessions()
+
+    @staticmethod
+    def _mcp_tool_info(tool_name: str, tool: Any, server: MCPServer) -> ToolInfo:
+        """Build the ToolInfo for a tool served by a stdio MCP server."""
+        return ToolInfo.model_construct(
+            name=tool_name,
+            description=getattr(tool, 'description', 'No description available'),
+            source=sys.intern(f"mcp_server:{server.name}"),
+            parameters=_tool_parameters(tool),
+            category=Category.MCP
+        )
 
-    async def _load_langchain_tools(self, server: HttpMCPServer) -> None:
+    def _load_http_server_tools(self, server: HttpMCPServer, force_refresh: bool = False):
+        """Dispatch to the loader matching the server's transport; returns an awaitable."""
+        # Use langchain adapters for SSE and streamable_http, custom aiohttp for regular http
+        if server.config.transport.lower() in ("sse", "streamable_http"):
+            return self._load_langchain_tools(server, force_refresh)
+        return self._load_aiohttp_tools(server, force_refresh)
+
+    async def _load_langchain_tools(self, server: HttpMCPServer, force_refresh: bool = False) -> List[Tuple[Any, ToolInfo]]:
         """Load tools from server using langchain adapters."""
         try:
-            tools = await server._langchain_client.get_tools()
-            
-            # Add tools directly (they're already in langchain format)
-            self.http_tools.extend(tools)
+            # Reuse the catalog the server fetched while connecting
+            tools = await (server.refresh_tools() if force_refresh else server.get_langchain_tools())
             
-            # Store tool info for each tool
-            for tool in tools:
-                tool_name = tool.name
-                self.tool_info[tool_name] = ToolInfo(
-                    name=tool_name,
+            # Tools are already in langchain format; pair each with its info
+            loaded = [
+                (tool, ToolInfo.model_construct(
+                    name=tool.name,
                     description=tool.description,
-                    source=f"http_server:{server.name}",
-                    parameters=getattr(tool, 'args_schema', {}),
-                    category="http"
-                )
+                    source=sys.intern(f"http_server:{server.name}"),
+                    parameters=_tool_parameters(tool),
+                    category=Category.HTTP
+                ))
+                for tool in tools
+            ]
             
-            logging.info(f"🔧 Loaded {len(tools)} tools from {server.name} (langchain adapters)")
+            logger.info("🔧 Loaded %s tools from %s (langchain adapters)", len(tools), server.name)
+            return loaded
             
         except Exception as e:
-            logging.error(f"❌ Error loading langchain tools from {server.name}: {e}")
+            logger.error("❌ Error loading langchain tools from %s: %s", server.name, e)
+            return []
 
-    async def _load_aiohttp_tools(self, server: HttpMCPServer) -> None:
+    async def _load_aiohttp_tools(self, server: HttpMCPServer, force_refresh: bool = False) -> List[Tuple[Any, ToolInfo]]:
         """Load tools from server using custom aiohttp implementation."""
         try:
+            # Not disk-cached: list_tools already revalidates with ETag / max-age
+            if force_refresh:
+                server.invalidate_tools_cache()
             tools_data = await server.list_tools()
             
             # Create langchain-compatible tools for HTTP servers
+            loaded = []
             for tool_data in tools_data:
                 tool = await self._create_http_tool(server, tool_data)
                 if tool:
-                    self.http_tools.append(tool)
-                    
-                    # Store tool info
-                    tool_name = tool_data.get('name', f'{server.name}_tool')
-                    self.tool_info[tool_name] = ToolInfo(
-                        name=tool_name,
+                    loaded.append((tool, ToolInfo.model_construct(
+                        name=tool_data.get('name', f'{server.name}_tool'),
                         description=tool_data.get('description', 'HTTP/SSE MCP tool'),
-                        source=f"http_server:{server.name}",
+                        source=sys.intern(f"http_server:{server.name}"),
                         parameters=tool_data.get('parameters', {}),
-                        category="http"
-                    )
+                        category=Category.HTTP
+                    )))
             
-            logging.info(f"🔧 Loaded {len(tools_data)} tools from {server.name} (aiohttp)")
+            logger.info("🔧 Loaded %s tools from %s (aiohttp)", len(tools_data), server.name)
+            return loaded
             
         except Exception as e:
-            logging.error(f"❌ Error loading aiohttp tools from {server.name}: {e}")
+            logger.error("❌ Error loading aiohttp tools from %s: %s", server.name, e)
+            return []
 
     async def _create_http_tool(self, server: HttpMCPServer, tool_data: Dict[str, Any]) -> Any:
         """Create a langchain-compatible tool for HTTP/SSE servers."""
-        from langchain.tools import BaseTool
-        
-        # Capture the server and tool_data in a closure
-        server_instance = server
-        tool_name = tool_data.get('name', 'http_tool')
-        tool_description = tool_data.get('description', 'HTTP/SSE MCP tool')
+        return _HttpMCPTool(
+            server,
+            tool_data.get('name', 'http_tool'),
+            description=tool_data.get('description', 'HTTP/SSE MCP tool')
+        )
         
-        class HttpMCPTool(BaseTool):
-            name: str = tool_name
-            description: str = tool_description
-            
-            def _run(self, **kwargs) -> str:
-                """Synchronous run method."""
-                raise NotImplementedError("Use async version")
-            
-            async def _arun(self, **kwargs) -> str:
-                """Asynchronous run method."""
-                try:
-                    result = await server_instance.call_tool(tool_name, kwargs)
-                    return str(result)
-                except Exception as e:
-                    return f"Error executing HTTP tool {tool_name}: {e}"
-        
-        return HttpMCPTool()
-        
-    async def _load_tools_from_server(self, server: MCPServer) -> List[Any]:
+    async def _load_tools_from_server(self, server: MCPServer, force_refresh: bool = False) -> List[Any]:
         """Load tools from a specific MCP server.
         
         Args:
             server: The MCP server to load tools from
+            force_refresh: Skip the discovery cache and call list_tools
             
         Returns:
             List of tools from the server
@@ -319,11 +878,24 @@ class ToolsManager:
             raise RuntimeError(f"Server {server.name} not initialized")
 
         try:
-            tools = await load_mcp_tools(server.session)
-            logging.info(f"📋 Loaded {len(tools)} tools from server {server.name}")
+            key = _catalog_key(server)
+            cached = None if force_refresh else self._cached_catalog(key)
+            if cached is not None:
+                tools = [convert_mcp_tool_to_langchain_tool(server.session, McpTool.model_validate(t)) for t in cached]
+                logger.info("📋 Loaded %s tools from server %s (discovery cache)", len(tools), server.name)
+                return tools
+            
+            mcp_tools = await _list_mcp_tools(server.session)
+            # Keep the full tool definitions (annotations, _meta, outputSchema) so a cache hit
+            # converts to the same LangChain tools as a live listing
+            self._remember_catalog(key, [
+                tool.model_dump(mode="json", by_alias=True, exclude_none=True) for tool in mcp_tools
+            ])
+            tools = [convert_mcp_tool_to_langchain_tool(server.session, tool) for tool in mcp_tools]
+            logger.info("📋 Loaded %s tools from server %s", len(tools), server.name)
             return tools
         except Exception as e:
-            logging.error(f"❌ Error loading tools from server {server.name}: {e}")
+            logger.error("❌ Error loading tools from server %s: %s", server.name, e)
             return []
     
     def add_custom_tools(self, tools: List[Any]) -> None:
@@ -335,15 +907,16 @@ class ToolsManager:
         for tool in tools:
             self.custom_tools.append(tool)
             tool_name = getattr(tool, 'name', str(tool))
-            self.tool_info[tool_name] = ToolInfo(
+            self._register_tool(tool_name, tool, Category.CUSTOM)
+            self._set_tool_info(ToolInfo.model_construct(
                 name=tool_name,
                 description=getattr(tool, 'description', 'Custom tool - no description available'),
                 source="custom",
-                parameters=getattr(tool, 'parameters', {}),
-                category="custom"
-            )
+                parameters=_tool_parameters(tool),
+                category=Category.CUSTOM
+            ))
         
-        logging.info(f"🔧 Added {len(tools)} custom tools")
+        logger.info("🔧 Added %s custom tools", len(tools))
     
     def add_see_tools(self, tools: List[Any]) -> None:
         """Add SEE tools to the manager.
@@ -354,15 +927,16 @@ class ToolsManager:
         for tool in tools:
             self.see_tools.append(tool)
             tool_name = getattr(tool, 'name', str(tool))
-            self.tool_info[tool_name] = ToolInfo(
+            self._register_tool(tool_name, tool, Category.SEE)
+            self._set_tool_info(ToolInfo.model_construct(
                 name=tool_name,
                 description=getattr(tool, 'description', 'SEE tool - vision and analysis'),
                 source="see",
-                parameters=getattr(tool, 'parameters', {}),
-                category="see"
-            )
+                parameters=_tool_parameters(tool),
+                category=Category.SEE
+            ))
         
-        logging.info(f"🔧 Added {len(tools)} SEE tools")
+        logger.info("🔧 Added %s SEE tools", len(tools))
     
     def get_all_tools(self) -> List[Any]:
         """Get all tools (MCP + HTTP + custom + SEE) wrapped with execution logging.
@@ -370,19 +944,22 @@ class ToolsManager:
         Returns:
             List of all available tools wrapped with logging
         """
-        all_tools = self.mcp_tools + self.http_tools + self.custom_tools + self.see_tools
-        
-        # Wrap each tool with logging
-        wrapped_tools = []
-        for tool in all_tools:
-            try:
-                wrapped_tool = wrap_tool_with_logging(tool)
-                wrapped_tools.append(wrapped_tool)
-            except Exception as e:
-                logging.warning(f"⚠️ Failed to wrap tool {getattr(tool, 'name', str(tool))} with logging: {e}")
-                wrapped_tools.append(tool)  # Use original tool if wrapping fails
+        if self._tools_dirty:
+            # Only tools added since the last call need wrapping; re-wrapping
+            # would stack another logging layer on each call.
+            wrapped = {id(tool) for tool in self.all_tools}
+            all_tools = []
+            for tool in self.mcp_tools + self.http_tools + self.custom_tools + self.see_tools:
+                if id(tool) not in wrapped:
+                    try:
+                        tool = wrap_tool_with_logging(tool)
+                    except Exception as e:
+                        logger.warning("⚠️ Failed to wrap tool %s with logging: %s", getattr(tool, 'name', tool), e)
+                all_tools.append(tool)
+            self.all_tools = all_tools
+            self._tools_dirty = False
         
-        return wrapped_tools
+        return list(self.all_tools)
     
     def get_tool_names(self) -> List[str]:
         """Get names of all available tools.
@@ -409,10 +986,7 @@ class ToolsManager:
         Returns:
             The tool object if found, None otherwise
         """
-        for tool in self.get_all_tools():
-            if getattr(tool, 'name', str(tool)) == tool_name:
-                return tool
-        return None
+        return self._tool_by_name.get(tool_name)
     
     def get_tools_by_source(self, source_type: str, source_name: Optional[str] = None) -> List[Any]:
         """Get tools by source type and optionally source name.
@@ -424,39 +998,17 @@ class ToolsManager:
         Returns:
             List of tools matching the criteria
         """
-        matching_tools = []
+        if source_type in ("custom", "see"):
+            source_name = None
+        elif source_type not in ("mcp_server", "http_server"):
+            return []
         
-        for tool_name, tool_info in self.tool_info.items():
-            if source_type == "custom" and tool_info.source == "custom":
-                tool = self.find_tool_by_name(tool_name)
-                if tool:
-                    matching_tools.append(tool)
-            elif source_type == "see" and tool_info.source == "see":
-                tool = self.find_tool_by_name(tool_name)
+        matching_tools = []
+        for tool_name, (kind, server_name) in self._source_pair.items():
+            if kind == source_type and (not source_name or server_name == source_name):
+                tool = self._tool_by_name.get(tool_name)
                 if tool:
                     matching_tools.append(tool)
-            elif source_type == "mcp_server":
-                if source_name:
-                    if tool_info.source == f"mcp_server:{source_name}":
-                        tool = self.find_tool_by_name(tool_name)
-                        if tool:
-                            matching_tools.append(tool)
-                else:
-                    if tool_info.source.startswith("mcp_server:"):
-                        tool = self.find_tool_by_name(tool_name)
-                        if tool:
-                            matching_tools.append(tool)
-            elif source_type == "http_server":
-                if source_name:
-                    if tool_info.source == f"http_server:{source_name}":
-                        tool = self.find_tool_by_name(tool_name)
-                        if tool:
-                            matching_tools.append(tool)
-                else:
-                    if tool_info.source.startswith("http_server:"):
-                        tool = self.find_tool_by_name(tool_name)
-                        if tool:
-                            matching_tools.append(tool)
         
         return matching_tools
     
@@ -473,11 +1025,38 @@ class ToolsManager:
             ValidationError: If the tool call data is invalid
         """
         try:
-            return ToolCall(**tool_call_data)
+            return TOOL_CALL_ADAPTER.validate_python(tool_call_data)
         except ValidationError as e:
-            logging.error(f"❌ Invalid tool call data: {e}")
+            logger.error("❌ Invalid tool call data: %s", e)
             raise
     
+    def _validate_arguments(self, tool_call: ToolCall) -> Optional[str]:
+        """Check a call's arguments against its tool's schema; returns an error message or None."""
+        adapter = self._arg_adapters.get(tool_call.tool, _UNBUILT)
+        if adapter is _UNBUILT:
+            tool_info = self.tool_info.get(tool_call.tool)
+            adapter = _build_args_adapter(tool_call.tool, tool_info.parameters if tool_info else None)
+            self._arg_adapters[tool_call.tool] = adapter
+        if adapter is None:
+            return None
+        
+        try:
+            adapter.validate_python(tool_call.arguments)
+        except ValidationError as e:
+            return f"Invalid arguments for tool '{tool_call.tool}': {e}"
+        return None
+    
+    @staticmethod
+    def _error_result(tool_name: str, error_msg: str, timestamp: Optional[datetime] = None) -> ToolResult:
+        """Build a failed ToolResult; batches pass one shared timestamp."""
+        return ToolResult.model_construct(
+            tool_name=tool_name,
+            success=False,
+            result=None,
+            error=error_msg,
+            timestamp=timestamp or datetime.now()
+        )
+    
     async def execute_tool_call(self, tool_call: ToolCall) -> ToolResult:
         """Execute a tool call and return the result.
         
@@ -489,98 +1068,208 @@ class ToolsManager:
         """
         try:
             tool = self.find_tool_by_name(tool_call.tool)
+            if tool is None and not (self._mcp_integrated and self._http_integrated):
+                tool = await self._find_tool_lazy(tool_call.tool)
             if not tool:
                 error_msg = f"Tool '{tool_call.tool}' not found"
-                logging.error(f"❌ {error_msg}")
-                return ToolResult(
-                    tool_name=tool_call.tool,
-                    success=False,
-                    result=None,
-                    error=error_msg
-                )
+                logger.error("❌ %s", error_msg)
+                return self._error_result(tool_call.tool, error_msg)
             
-            # Get tool info for approval display
-            tool_info = self.tool_info.get(tool_call.tool)
+            error_msg = self._validate_arguments(tool_call)
+            if error_msg:
+                logger.error("❌ %s", error_msg)
+                return self._error_result(tool_call.tool, error_msg)
             
             # Check if approval is required
             if self.approval_enabled:
-                self._display_tool_approval_request(tool_call.tool, tool_call.arguments, tool_info)
-                if not self._get_user_approval():
-                    return ToolResult(
-                        tool_name=tool_call.tool,
-                        success=False,
-                        result=None,
-                        error="Tool execution disapproved by user"
-                    )
+                if not await self._request_approval([tool_call]):
+                    return self._error_result(tool_call.tool, "Tool execution disapproved by user")
+            
+        except Exception as e:
+            error_msg = f"Error executing tool '{tool_call.tool}': {str(e)}"
+            logger.error("❌ %s", error_msg)
+            return self._error_result(tool_call.tool, error_msg)
+        
+        return await self._run_tool(tool, tool_call)
+    
+    async def execute_tool_calls(self, tool_calls: List[ToolCall], max_concurrency: int = 8) -> List[ToolResult]:
+        """Execute several tool calls concurrently behind a single approval prompt.
+        
+        Args:
+            tool_calls: Validated tool calls to execute
+            max_concurrency: Maximum number of tools running at once
             
+        Returns:
+            ToolResult objects in the same order as tool_calls
+        """
+        if not tool_calls:
+            return []
+        
+        # A batch will usually touch several tools, so discover everything once up front
+        try:
+            await self._ensure_loaded()
+        except Exception as e:
+            logger.error("❌ Error loading tools for batch execution: %s", e)
+        
+        # One clock read stamps every result in the batch
+        now = datetime.now()
+        
+        # Resolve each distinct tool name once
+        tools = {name: self.find_tool_by_name(name) for name in {call.tool for call in tool_calls}}
+        results: List[Optional[ToolResult]] = [None] * len(tool_calls)
+        runnable = []
+        for index, call in enumerate(tool_calls):
+            if tools[call.tool]:
+                error_msg = self._validate_arguments(call)
+            else:
+                error_msg = f"Tool '{call.tool}' not found"
+            
+            if error_msg:
+                logger.error("❌ %s", error_msg)
+                results[index] = self._error_result(call.tool, error_msg, now)
+            else:
+                runnable.append(index)
+        
+        if runnable and self.approval_enabled:
+            if not await self._request_approval([tool_calls[index] for index in runnable]):
+                for index in runnable:
+                    results[index] = self._error_result(tool_calls[index].tool, "Tool execution disapproved by user", now)
+                return results
+        
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def run(index: int) -> None:
+            call = tool_calls[index]
+            async with semaphore:
+                results[index] = await self._run_tool(tools[call.tool], call, now)
+        
+        await asyncio.gather(*(run(index) for index in runnable))
+        return results
+    
+    def _display_batch_approval_request(self, tool_calls: List[ToolCall]) -> None:
+        """Display one approval request covering a batch of tool calls."""
+        lines = [f"\n🔧 Tool Approval Request ({len(tool_calls)} calls):"]
+        for number, call in enumerate(tool_calls, 1):
+            tool_info = self.tool_info.get(call.tool)
+            source = tool_info.source if tool_info else "unknown"
+            lines.append(f"  {number}. 📋 {call.tool} (🌐 {source}) ⚙️ {call.arguments}")
+        lines.append(f"\n❓ Do you want to approve all {len(tool_calls)} tool executions?")
+        lines.append("   1 - ✅ Approve all")
+        lines.append("   2 - ❌ Disapprove all")
+        print("\n".join(lines))
+    
+    async def _run_tool(self, tool: Any, tool_call: ToolCall, timestamp: Optional[datetime] = None) -> ToolResult:
+        """Invoke a resolved tool and wrap the outcome in a ToolResult.
+        
+        Args:
+            tool: The resolved tool object
+            tool_call: The call to execute
+            timestamp: Timestamp for the result; read from the clock when not given
+        """
+        tool_info = self.tool_info.get(tool_call.tool)
+        call_key = None
+        if tool_info is not None and tool_info.cacheable and self._call_cache_size > 0:
+            call_key = self._call_key(tool_call)
+            cached = self._call_cache.get(call_key)
+            if cached is not None:
+                if cached[0] > time.monotonic():
+                    self._call_cache.move_to_end(call_key)
+                    logger.info("♻️ Reusing cached result for tool: %s", tool_call.tool)
+                    return cached[1].model_copy(update={"timestamp": timestamp or datetime.now()})
+                del self._call_cache[call_key]
+        
+        try:
             # Execute the tool
-            logging.info(f"🔧 Executing tool: {tool_call.tool}")
-            logging.info(f"📝 Arguments: {tool_call.arguments}")
+            logger.info("🔧 Executing tool: %s", tool_call.tool)
+            logger.info("📝 Arguments: %s", tool_call.arguments)
+            
+            dispatch = self._tool_dispatch.get(tool_call.tool)
+            kind = dispatch[1] if dispatch is not None and dispatch[0] is tool else _dispatch_kind(tool)
             
-            # For langchain tools, use invoke method
-            if hasattr(tool, 'invoke'):
-                result = await tool.ainvoke(tool_call.arguments) if hasattr(tool, 'ainvoke') else tool.invoke(tool_call.arguments)
-            elif hasattr(tool, 'run'):
-                result = await tool.arun(tool_call.arguments) if hasattr(tool, 'arun') else tool.run(tool_call.arguments)
-            elif callable(tool):
-                result = await tool(**tool_call.arguments) if hasattr(tool, '__await__') else tool(**tool_call.arguments)
+            if kind == "ainvoke":
+                result = await tool.ainvoke(tool_call.arguments)
+            elif kind == "invoke":
+                result = tool.invoke(tool_call.arguments)
+            elif kind == "arun":
+                result = await tool.arun(tool_call.arguments)
+            elif kind == "run":
+                result = tool.run(tool_call.arguments)
+            elif kind == "acall":
+                result = await tool(**tool_call.arguments)
+            elif kind == "call":
+                result = tool(**tool_call.arguments)
             else:
                 error_msg = f"Tool '{tool_call.tool}' is not executable"
-                logging.error(f"❌ {error_msg}")
-                return ToolResult(
-                    tool_name=tool_call.tool,
-                    success=False,
-                    result=None,
-                    error=error_msg
-                )
+                logger.error("❌ %s", error_msg)
+                return self._error_result(tool_call.tool, error_msg, timestamp)
             
-            logging.info(f"✅ Tool '{tool_call.tool}' executed successfully")
-            logging.info(f"📊 Result: {str(result)[:200]}{'...' if len(str(result)) > 200 else ''}")
-            return ToolResult(
+            logger.info("✅ Tool '%s' executed successfully", tool_call.tool)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("📊 Result: %s", _truncate(result, 200))
+            tool_result = ToolResult.model_construct(
                 tool_name=tool_call.tool,
                 success=True,
                 result=result,
-                error=None
+                error=None,
+                timestamp=timestamp or datetime.now()
             )
             
+            # Only successful results are cached, so a transient failure is retried next time
+            if call_key is not None:
+                self._call_cache[call_key] = (time.monotonic() + tool_info.ttl, tool_result)
+                if len(self._call_cache) > self._call_cache_size:
+                    self._call_cache.popitem(last=False)
+            return tool_result
+            
         except Exception as e:
             error_msg = f"Error executing tool '{tool_call.tool}': {str(e)}"
-            logging.error(f"❌ {error_msg}")
-            return ToolResult(
-                tool_name=tool_call.tool,
-                success=False,
-                result=None,
-                error=error_msg
-            )
+            logger.error("❌ %s", error_msg)
+            return self._error_result(tool_call.tool, error_msg, timestamp)
     
     def get_tools_summary(self) -> Dict[str, Any]:
         """Get a summary of all available tools.
         
         Returns:
-            Dictionary with tools summary
+            Dictionary with tools summary (a fresh copy the caller may modify)
         """
+        summary = self._cached_tools_summary()
+        # Structural copy: only the containers are shared-mutable, tool names are strings
+        return {
+            **summary,
+            "mcp_tools": {
+                **summary["mcp_tools"],
+                "by_server": {k: list(v) for k, v in summary["mcp_tools"]["by_server"].items()}
+            },
+            "http_tools": {
+                **summary["http_tools"],
+                "by_server": {k: list(v) for k, v in summary["http_tools"]["by_server"].items()}
+            },
+            "custom_tools": dict(summary["custom_tools"]),
+            "see_tools": dict(summary["see_tools"]),
+            "tool_names": list(summary["tool_names"])
+        }
+    
+    def _cached_tools_summary(self) -> Dict[str, Any]:
+        """Return the memoized summary; shared, so callers must not modify it."""
+        if self._summary_cache is not None and self._summary_cache[0] == self._mutation_version:
+            return self._summary_cache[1]
+        
         mcp_tools_by_server = {}
         http_tools_by_server = {}
         custom_tools_count = 0
         see_tools_count = 0
         
-        for tool_name, tool_info in self.tool_info.items():
-            if tool_info.source == "custom":
+        for tool_name, (kind, server_name) in self._source_pair.items():
+            if kind == "custom":
                 custom_tools_count += 1
-            elif tool_info.source == "see":
+            elif kind == "see":
                 see_tools_count += 1
-            elif tool_info.source.startswith("mcp_server:"):
-                server_name = tool_info.source.split(":")[1]
-                if server_name not in mcp_tools_by_server:
-                    mcp_tools_by_server[server_name] = []
-                mcp_tools_by_server[server_name].append(tool_name)
-            elif tool_info.source.startswith("http_server:"):
-                server_name = tool_info.source.split(":")[1]
-                if server_name not in http_tools_by_server:
-                    http_tools_by_server[server_name] = []
-                http_tools_by_server[server_name].append(tool_name)
+            elif kind == "mcp_server":
+                mcp_tools_by_server.setdefault(server_name, []).append(tool_name)
+            elif kind == "http_server":
+                http_tools_by_server.setdefault(server_name, []).append(tool_name)
         
-        return {
+        summary = {
             "total_tools": len(self.tool_info),
             "mcp_tools": {
                 "total": len(self.mcp_tools),
@@ -598,33 +1287,46 @@ class ToolsManager:
             },
             "tool_names": list(self.tool_info.keys())
         }
+        self._summary_cache = (self._mutation_version, summary)
+        return summary
     
     def print_tools_summary(self) -> None:
         """Print a formatted summary of all available tools."""
-        summary = self.get_tools_summary()
+        if self._summary_text is None or self._summary_text[0] != self._mutation_version:
+            self._summary_text = (self._mutation_version, self._format_tools_summary())
+        # One write instead of a print per line
+        print(self._summary_text[1])
+    
+    def _format_tools_summary(self) -> str:
+        """Render the tools summary as printable text."""
+        summary = self._cached_tools_summary()
         
-        print(f"\n🔧 Tools Summary:")
-        print(f"📊 Total tools: {summary['total_tools']}")
+        lines = [
+            "\n🔧 Tools Summary:",
+            f"📊 Total tools: {summary['total_tools']}",
+        ]
         
         if summary['mcp_tools']['total'] > 0:
-            print(f"\n🌐 MCP Tools ({summary['mcp_tools']['total']}):")
+            lines.append(f"\n🌐 MCP Tools ({summary['mcp_tools']['total']}):")
             for server_name, tools in summary['mcp_tools']['by_server'].items():
-                print(f"  📋 {server_name}: {', '.join(tools)}")
+                lines.append(f"  📋 {server_name}: {', '.join(tools)}")
         
         if summary['http_tools']['total'] > 0:
-            print(f"\n🌍 HTTP/SSE Tools ({summary['http_tools']['total']}):")
+            lines.append(f"\n🌍 HTTP/SSE Tools ({summary['http_tools']['total']}):")
             for server_name, tools in summary['http_tools']['by_server'].items():
-                print(f"  📋 {server_name}: {', '.join(tools)}")
+                lines.append(f"  📋 {server_name}: {', '.join(tools)}")
         
         if summary['custom_tools']['total'] > 0:
-            custom_tools = [name for name, info in self.tool_info.items() if info.source == "custom"]
-            print(f"\n🛠️ Custom Tools ({summary['custom_tools']['total']}):")
-            print(f"  📋 {', '.join(custom_tools)}")
+            custom_tools = [name for name, (kind, _) in self._source_pair.items() if kind == "custom"]
+            lines.append(f"\n🛠️ Custom Tools ({summary['custom_tools']['total']}):")
+            lines.append(f"  📋 {', '.join(custom_tools)}")
         
         if summary['see_tools']['total'] > 0:
-            see_tools = [name for name, info in self.tool_info.items() if info.source == "see"]
-            print(f"\n👁️ SEE Tools ({summary['see_tools']['total']}):")
-            print(f"  📋 {', '.join(see_tools)}")
+            see_tools = [name for name, (kind, _) in self._source_pair.items() if kind == "see"]
+            lines.append(f"\n👁️ SEE Tools ({summary['see_tools']['total']}):")
+            lines.append(f"  📋 {', '.join(see_tools)}")
         
         if summary['total_tools'] == 0:
-            print("⚠️ No tools available")
+            lines.append("⚠️ No tools available")
+        
+        return "\n".join(lines)